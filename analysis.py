@@ -0,0 +1,100 @@
+# ai_news_verifier_app/analysis.py
+"""Headless analysis core: everything the Streamlit page does, minus the page."""
+from typing import Dict, List, Tuple
+
+import dedup
+import metrics
+import pipeline
+from sources import fetch_all
+from llm import GROQ_MODEL, fake_check
+from pipeline import Article
+from singleflight import SingleFlight
+from store import article_store, keyword_key
+
+ARTICLES_PER_SOURCE = 15
+
+# Sessions asking for the same topic at the same time share one run.
+collect_flights = SingleFlight("collect")
+topic_flights = SingleFlight("analyze_topic")
+
+
+def collect_articles(
+    keyword: str, days: int, per_source: int = ARTICLES_PER_SOURCE
+) -> Tuple[List[Article], Dict[str, str]]:
+    """Fetch what the article store lacks, then load, collapse near-duplicates, score and label.
+
+    Only articles newer than the newest stored one (and days the store has
+    never covered) are requested; the rest come from the store with their
+    polarity and summaries. Scores are written back for next time.
+
+    Concurrent calls for the same (keyword, days, per_source) share one run.
+
+    Returns (articles, fetch_errors); a failed source only shows up in the errors.
+    """
+    articles, errors = collect_flights.do(
+        (keyword_key(keyword), days, per_source), _collect_articles, keyword, days, per_source
+    )
+    # Callers share the Article objects but each gets its own list to page through.
+    return list(articles), dict(errors)
+
+
+def _collect_articles(keyword: str, days: int, per_source: int) -> Tuple[List[Article], Dict[str, str]]:
+    with metrics.span("fetch"):
+        fetched, errors = fetch_all(keyword, days, article_store.missing_windows(keyword, days))
+    with metrics.span("store"):
+        article_store.add(keyword, days, fetched, errors)
+        articles = article_store.load(keyword, days, per_source)
+    with metrics.span("dedup"):
+        articles = dedup.collapse(articles)
+    with metrics.span("score"):
+        pipeline.score([a for a in articles if a.polarity is None])
+    with metrics.span("label"):
+        pipeline.label(articles)
+    article_store.update(articles)
+    return articles, errors
+
+
+def analyze_topic(
+    keyword: str,
+    days: int,
+    per_source: int = ARTICLES_PER_SOURCE,
+    summarize: bool = True,
+    check: bool = True,
+) -> dict:
+    """Full analysis of one topic, as plain data.
+
+    The returned dict has the Article list under "articles" plus topic-level
+    fields (label counts, mean polarity, fetch errors, fake-news check).
+    Concurrent calls with the same arguments and model share one run.
+    """
+    key = (keyword_key(keyword), days, GROQ_MODEL, per_source, summarize, check)
+    with metrics.trace("analyze_topic", keyword=keyword, days=days):
+        result = topic_flights.do(key, _analyze_topic, keyword, days, per_source, summarize, check)
+    return {**result, "articles": list(result["articles"]), "errors": dict(result["errors"])}
+
+
+def _analyze_topic(keyword: str, days: int, per_source: int, summarize: bool, check: bool) -> dict:
+    articles, errors = collect_articles(keyword, days, per_source)
+    if summarize:
+        with metrics.span("summarize"):
+            pipeline.summarize([a for a in articles if a.summary is None])
+        article_store.update(articles)
+
+    result = {
+        "keyword": keyword,
+        "days": days,
+        "articles": articles,
+        "article_count": len(articles),
+        "label_counts": pipeline.label_counts(articles),
+        "mean_polarity": (
+            round(sum(a.polarity for a in articles) / len(articles), 7) if articles else None
+        ),
+        "errors": dict(errors),
+        "fake_check": None,
+    }
+    if check and articles:
+        try:
+            result["fake_check"] = fake_check("\n".join(a.title for a in articles))
+        except Exception as e:
+            result["errors"]["fake_check"] = str(e)
+    return result
@@ -1,105 +1,178 @@
 # ai_news_verifier_app/app.py
-import os
 import streamlit as st
-import requests
-import pandas as pd
-import matplotlib.pyplot as plt
-from textblob import TextBlob
-from datetime import datetime, timedelta
-from groq import Groq
-from matplotlib import cm
-from time import sleep
 
-# --- API KEYS ---
-NEWS_API_KEY = os.getenv("NEWS_API_KEY")
-POLYGON_API_KEY = os.getenv("POLYGON_API_KEY")
-GROQ_API_KEY = os.getenv("GROQ_API_KEY")
+import charts
+from analysis import collect_articles
+from cache import llm_cache
+from fetchers import FETCH_ARTICLE_BUDGET
+from store import article_store
+from llm import FAKE_CHECK_FALLBACK, fake_check
+import metrics
+import pipeline
+import singleflight
+import timeline
+from snapshots import SnapshotCache, new_snapshot
 
-# You can optionally guard this more nicely, but assuming key is set:
-client = Groq(api_key=GROQ_API_KEY)
 
-GROQ_MODEL = "llama-3.1-8b-instant"  # single source of truth for model
+CARDS_PER_PAGE = 7  # news cards per page; each page is summarized only when shown
 
 
-def summarize_with_groq(full_text: str) -> str:
-    """Summarize one article with Groq, with simple error handling."""
-    prompt = f"Summarize this news in one short paragraph: {full_text}"
+# --- GROQ FAKE NEWS & WELLNESS ---
+def llm_fake_check(news_list, on_text=None):
     try:
-        response = client.chat.completions.create(
-            model=GROQ_MODEL,
-            messages=[{"role": "user", "content": prompt}],
-        )
-        # small delay to avoid hammering the API
-        sleep(0.7)
-        return response.choices[0].message.content.strip()
+        return fake_check(news_list, on_text)
     except Exception as e:
-        # You can inspect e if you want, but keep it user-friendly in UI
-        return "(Summary not available due to rate limit or API error.)"
-
-# --- CRISIS KEYWORDS & SENTIMENT LABELING ---
-
-CRISIS_KEYWORDS = [
-    # Death / Injury / Disaster
-    "kill", "killed", "kills", "dead", "death", "deaths", "injured", "injury",
-    "hospitalized", "critical", "fatal", "fatalities", "casualties", "massacre",
-    "tragedy", "catastrophe", "horror", "collapse", "died",
-
-    # Violence / Crime / Abuse
-    "attack", "attacked", "shot", "shooting", "gunfire", "gunman", "murder",
-    "murdered", "assault", "rape", "raped", "molested", "harassment",
-    "abuse", "abused", "abducted", "kidnapped", "trafficking", "crime",
-    "violent", "violence", "stabbed", "acid attack", "victim",
-
-    # War / Terrorism
-    "terror", "terrorist", "bomb", "bombing", "explosion", "missile",
-    "airstrike", "war", "conflict", "invasion", "clash", "hostage",
-    "militia", "genocide", "extremist",
-
-    # Natural Disaster
-    "earthquake", "tsunami", "volcano", "eruption", "flood", "floods",
-    "landslide", "landslides", "cyclone", "hurricane", "tornado",
-    "storm", "wildfire", "fire", "burned", "scorching", "heatwave",
-
-    # Public Health / Disease
-    "outbreak", "infection", "disease", "epidemic", "pandemic",
-    "virus", "covid", "ebola", "cholera", "outbreaks", "poisoned",
-
-    # Economic / Social Crisis
-    "collapse", "bankruptcy", "inflation", "recession", "unemployment",
-    "poverty", "homeless", "famine", "shortage", "crisis",
-
-    # Safety Threats / Accidents
-    "accident", "crash", "collision", "derailed", "plane crash",
-    "train crash", "bus crash", "injuries",
-
-    # Hate / Discrimination
-    "racism", "hate crime", "lynching", "discrimination",
-    "religious violence", "honor killing", "hate speech",
-]
-
+        st.error(f"⚠️ Groq API error: {str(e)}")
+        return FAKE_CHECK_FALLBACK
+
+
+def render_article_card(slot, article: pipeline.Article):
+    """Draw (or redraw) one news card into an `st.empty()` slot."""
+    sentiment_class = (
+        "sentiment-positive" if article.label == "Positive"
+        else "sentiment-negative" if article.label == "Negative"
+        else "sentiment-neutral"
+    )
+    summary = article.summary if article.summary is not None else "<i>⏳ Summarizing…</i>"
+    reported = ""
+    if len(article.sources) > 1:
+        per_source = ", ".join(
+            f"{source} ×{article.sources.count(source)}" for source in dict.fromkeys(article.sources)
+        )
+        reported = f"<br><small>🔁 Reported {len(article.sources)} times ({per_source})</small>"
+    slot.markdown(
+        f"<div class='news-block'>"
+        f"<b>{article.title}</b><br>"
+        f"<span class='{sentiment_class}'>Sentiment: {article.label}</span>{reported}<br><br>"
+        f"{summary}<br><br>"
+        f"<a href='{article.url}' target='_blank'>Read Full News</a>"
+        f"</div>",
+        unsafe_allow_html=True,
+    )
 
-def analyze_sentiment(text: str) -> float:
-    """Return TextBlob polarity score."""
-    return round(TextBlob(text).sentiment.polarity, 7)
 
+def show_more(analysis: dict):
+    analysis["shown"] += CARDS_PER_PAGE
 
-def label_sentiment(score: float, text: str) -> str:
-    """Convert score + text into Positive / Neutral / Negative."""
-    lower_text = text.lower()
 
-    # Base thresholds (more sensitive)
-    if score > 0.1:
-        label = "Positive"
-    elif score < -0.1:
-        label = "Negative"
+def show_chart(chart: charts.Chart):
+    if chart.backend == "vega":
+        st.vega_lite_chart(chart.payload, width="stretch")
     else:
-        label = "Neutral"
+        st.image(chart.payload, width="stretch")
+
+
+def render_analysis(analysis: dict) -> bool:
+    """Cards, charts and fake-news check for one analysis held in session state.
+
+    Returns True when this render had to summarize or scan anything.
+    """
+    articles = analysis["articles"]
+
+    did_work = False
+
+    # --- DISPLAY NEWS ---
+    # Cards go up right away with their sentiment. Only articles on the shown
+    # pages get summarized; each summary fills its card in as it arrives.
+    st.subheader("📰 News Analysis")
+    visible = articles[:analysis["shown"]]
+    card_slots = [st.empty() for _ in visible]
+    for slot, article in zip(card_slots, visible):
+        render_article_card(slot, article)
+    if len(visible) < len(articles):
+        st.button(
+            f"⬇️ Show more ({len(articles) - len(visible)} left)",
+            on_click=show_more,
+            args=(analysis,),
+        )
 
-    # Crisis override: if text clearly mentions bad stuff, force Negative
-    if any(word in lower_text for word in CRISIS_KEYWORDS):
-        label = "Negative"
+    # --- CHARTS SIDE BY SIDE ---
+    st.subheader("📊 Sentiment Charts")
+    st.caption(
+        f"📈 Sentiment based on all {len(articles)} distinct stories across sources "
+        f"(reposts counted once, {len(visible)} shown above)."
+    )
+    col1, col2 = st.columns(2)
 
-    return label
+    with metrics.span("charts"):
+        with col1:
+            show_chart(charts.polarity_chart([article.polarity for article in articles]))
+        with col2:
+            show_chart(charts.distribution_chart(pipeline.label_counts(articles)))
+
+    # --- SENTIMENT OVER TIME (whole window, on request) ---
+    st.subheader("📅 Sentiment Over Time")
+    if analysis.get("timeline") is None and st.button(
+        f"📈 Scan all {analysis['days']} days (up to {FETCH_ARTICLE_BUDGET} articles per source)"
+    ):
+        with st.spinner("Walking every page of results…"):
+            analysis["timeline"] = timeline.sentiment_timeline(analysis["keyword"], analysis["days"])
+        did_work = True
+    result = analysis.get("timeline")
+    if result is not None:
+        for source, error in result["errors"].items():
+            st.warning(f"⚠️ {source} stopped early: {error}")
+        if result["buckets"]:
+            show_chart(charts.timeline_chart(result["buckets"]))
+            st.caption(
+                f"📈 {result['article_count']} articles over {len(result['buckets'])} days "
+                f"({result['reposts_skipped']} reposts skipped)."
+            )
+        else:
+            st.info("No dated articles found in this window.")
+
+    # --- GROQ SUMMARY ---
+    st.subheader("🧠 AI Fake News Check & Wellness Advice")
+    check_slot = st.empty()
+    check_slot.markdown("<div class='news-block'>⏳ Checking headlines…</div>", unsafe_allow_html=True)
+
+    # --- SUMMARIZE ON VIEW, STREAMING INTO THE CARDS ---
+    pending = [article for article in visible if article.summary is None]
+    slot_of = {id(article): slot for slot, article in zip(card_slots, visible)}
+    with metrics.span("summarize"):
+        for article in pipeline.summarize_iter(pending):
+            render_article_card(slot_of[id(article)], article)
+    if pending:
+        article_store.update(pending)
+
+    # --- FAKE NEWS CHECK (last, once per analysis) ---
+    if analysis["ai_response"] is None:
+        combined = "\n".join(article.title for article in articles)
+
+        def show_partial(text):
+            check_slot.markdown(f"<div class='news-block'>{text}▌</div>", unsafe_allow_html=True)
+
+        with metrics.span("fake_check"):
+            ai_response = llm_fake_check(combined, on_text=show_partial)
+        if ai_response:
+            ai_response = ai_response.replace("**Analysis:**", "").strip()
+        analysis["ai_response"] = ai_response
+    check_slot.markdown(f"<div class='news-block'>{analysis['ai_response']}</div>", unsafe_allow_html=True)
+    return did_work or bool(pending)
+
+
+def render_debug_sidebar(run, snapshots: SnapshotCache):
+    """Optional per-stage timings of the last run that did work, plus process totals."""
+    if not st.sidebar.checkbox("🛠 Debug metrics"):
+        return
+    if run is not None:
+        st.sidebar.markdown(f"**Last run** ({run.fields.get('keyword')!r}, {run.fields.get('days')} days)")
+        st.sidebar.table({
+            "stage": list(run.totals()),
+            "seconds": [round(seconds, 3) for seconds in run.totals().values()],
+        })
+    snapshot = metrics.registry.snapshot()
+    st.sidebar.markdown("**Groq / fetch counters**")
+    st.sidebar.json(snapshot["counters"])
+    st.sidebar.markdown("**LLM cache**")
+    st.sidebar.json(llm_cache.stats())
+    st.sidebar.markdown("**Session snapshots**")
+    st.sidebar.json(snapshots.stats())
+    st.sidebar.markdown("**Shared in-flight work** (waiters per key)")
+    st.sidebar.json({
+        group: {str(key)[:80]: waiters for key, waiters in keys.items()}
+        for group, keys in singleflight.in_flight().items()
+    })
 
 
 def main():
@@ -144,192 +217,36 @@ def main():
     days = st.slider("📆 Look back over how many days?", min_value=1, max_value=31, value=3)
 
     analyze = st.button("🔍 Analyze News")
+    snapshots = st.session_state.setdefault("snapshots", SnapshotCache())
 
     # --- BUTTON TO TRIGGER ---
-    if analyze and keyword:
-        # --- FETCH NEWSAPI.ORG ---
-        def fetch_newsapi_news(keyword, days):
-            from_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
-            url = (
-                "https://newsapi.org/v2/everything"
-                f"?q={keyword}"
-                f"&from={from_date}"
-                "&language=en&sortBy=publishedAt&pageSize=30"
-                f"&apiKey={NEWS_API_KEY}"
-            )
-            res = requests.get(url)
-            if res.status_code == 200:
-                return res.json().get("articles", [])
-            return []
-
-        # --- FETCH POLYGON ---
-        def fetch_polygon_news(keyword, days):
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=days)
-            url = (
-                "https://api.polygon.io/v2/reference/news"
-                f"?ticker={keyword.upper()}"
-                f"&published_utc.gte={start_date.strftime('%Y-%m-%d')}"
-                "&sort=published_utc&order=desc&limit=50"
-                f"&apiKey={POLYGON_API_KEY}"
-            )
-            res = requests.get(url)
-            if res.status_code == 200:
-                return res.json().get("results", [])
-            return []
-
-        # --- ANALYZE SENTIMENT ---
-        # def analyze_sentiment(text):
-        #     return round(TextBlob(text).sentiment.polarity, 7)
-
-        # --- GROQ FAKE NEWS & WELLNESS ---
-        def llm_fake_check(news_list):
-            prompt = f"""
-You are an AI truth checker and wellness advisor. Analyze the following news headlines.
-- Detect any that seem fake or manipulative.
-- Summarize the overall trend.
-- Provide mental wellness tips if sentiment is negative.
-
-News:
-{news_list}
-"""
-            try:
-                response = client.chat.completions.create(
-                    model=GROQ_MODEL,
-                    messages=[{"role": "user", "content": prompt}],
-                )
-                return response.choices[0].message.content.strip()
-            except Exception as e:
-                st.error(f"⚠️ Groq API error: {str(e)}")
-                return "(Unable to generate summary due to rate limit or API error.)"
-
-        newsapi_news = fetch_newsapi_news(keyword, days)[:15]
-        polygon_news = fetch_polygon_news(keyword, days)[:15]
-
-        headlines = []
-        sentiments = []
-        summaries = []
-        links = []
-
-        # --- NEWSAPI ARTICLES ---
-        for item in newsapi_news:
-            title = item.get("title", "") or ""
-            desc = item.get("description", "") or ""
-            url = item.get("url", "") or ""
-            full = f"{title} {desc}"
-            sentiment = analyze_sentiment(full)
-            sentiment_label = label_sentiment(sentiment, full)
-            # sentiment_label = (
-            #     "Positive" if sentiment > 0.2
-            #     else "Negative" if sentiment < -0.2
-            #     else "Neutral"
-            # )
-
-            summary = summarize_with_groq(full)
-
-            headlines.append(title)
-            sentiments.append(sentiment)
-            summaries.append(summary)
-            links.append(url)
-
-        # --- POLYGON ARTICLES ---
-        for item in polygon_news:
-            title = item.get("title", "") or ""
-            desc = item.get("description", "") or ""
-            url = item.get("article_url", "") or ""
-            full = f"{title} {desc}"
-            sentiment = analyze_sentiment(full)
-            sentiment_label = label_sentiment(sentiment, full)
-            # sentiment_label = (
-            #     "Positive" if sentiment > 0.2
-            #     else "Negative" if sentiment < -0.2
-            #     else "Neutral"
-            # )
-
-            summary = summarize_with_groq(full)
-
-            headlines.append(title)
-            sentiments.append(sentiment)
-            summaries.append(summary)
-            links.append(url)
-
-        # --- DISPLAY NEWS ---
-        st.subheader("📰 News Analysis")
-        for i in range(min(7, len(headlines))):  # only display first 7
-
-            sentiment_label = label_sentiment(sentiments[i], headlines[i])
-            
-            # sentiment_label = (
-            #     "Positive" if sentiments[i] > 0.2
-            #     else "Negative" if sentiments[i] < -0.2
-            #     else "Neutral"
-            # )
-            sentiment_class = (
-                "sentiment-positive" if sentiment_label == "Positive"
-                else "sentiment-negative" if sentiment_label == "Negative"
-                else "sentiment-neutral"
-            )
-            with st.container():
-                st.markdown(
-                    f"<div class='news-block'>"
-                    f"<b>{headlines[i]}</b><br>"
-                    f"<span class='{sentiment_class}'>Sentiment: {sentiment_label}</span><br><br>"
-                    f"{summaries[i]}<br><br>"
-                    f"<a href='{links[i]}' target='_blank'>Read Full News</a>"
-                    f"</div>",
-                    unsafe_allow_html=True,
-                )
-
-        # --- CHARTS SIDE BY SIDE ---
-        st.subheader("📊 Sentiment Charts")
-        st.caption("📈 Sentiment based on top 30 news articles across sources (only 7 shown above).")
-        col1, col2 = st.columns(2)
-
-        with col1:
-            fig, ax = plt.subplots(figsize=(5, 4))
-            fig.patch.set_facecolor('#E7F6FF')
-            ax.set_facecolor('#F5FDFF')
-            cmap = cm.get_cmap('RdYlGn')
-            colors = [cmap((s + 1) / 2) for s in sentiments]
-            ax.set_title("Sentiment Polarity", color='black', pad=20)
-            ax.bar(range(len(sentiments)), sentiments, color=colors)
-            ax.set_xlabel("Article Index", color='black')
-            ax.set_ylabel("Polarity (-1 to 1)", color='black')
-            ax.tick_params(axis='x', colors='black')
-            ax.tick_params(axis='y', colors='black')
-            st.pyplot(fig)
-
-        with col2:
-            labels = [label_sentiment(s, h) for s, h in zip(sentiments, headlines)]
-            positive = labels.count("Positive")
-            neutral = labels.count("Neutral")
-            negative = labels.count("Negative")
-            # positive = sum(1 for s in sentiments if s > 0.2)
-            # neutral = sum(1 for s in sentiments if -0.2 <= s <= 0.2)
-            # negative = sum(1 for s in sentiments if s < -0.2)
-            pie_fig, pie_ax = plt.subplots(figsize=(5, 4))
-            pie_fig.patch.set_facecolor('#E7F6FF')
-            pie_ax.set_facecolor('#111111')
-            pie_ax.pie(
-                [positive, neutral, negative],
-                labels=["Positive", "Neutral", "Negative"],
-                colors=["#28a745", "#6c757d", "#dc3545"],
-                autopct='%1.1f%%',
-                textprops={'color': "BLACK"},
-            )
-            pie_ax.set_title("Overall Sentiment Distribution", color='black')
-            st.pyplot(pie_fig)
-
-        # --- GROQ SUMMARY ---
-        st.subheader("🧠 AI Fake News Check & Wellness Advice")
-        combined = "\n".join(headlines)
-        ai_response = llm_fake_check(combined)
-        if ai_response:
-            ai_response = ai_response.replace("**Analysis:**", "").strip()
-        st.markdown(f"<div class='news-block'>{ai_response}</div>", unsafe_allow_html=True)
-
-    elif keyword:
-        st.info("Press the 'Analyze News' button to see results.")
+    with metrics.trace("page", keyword=keyword, days=days) as run:
+        if analyze and keyword:
+            # --- FETCH -> NORMALIZE -> SCORE -> LABEL (summaries happen on view) ---
+            articles, fetch_errors = collect_articles(keyword, days)
+            for source, error in fetch_errors.items():
+                st.warning(f"⚠️ Could not fetch {source} news: {error}")
+
+            # Kept per (keyword, days) so reruns (paging, sliders, going back to
+            # an earlier topic) re-render it instead of fetching again.
+            snapshots.put(new_snapshot(keyword, days, articles, CARDS_PER_PAGE))
+
+        did_work = analyze and keyword
+        analysis = snapshots.get(keyword, days) if keyword else None
+        if analysis is not None:
+            did_work = render_analysis(analysis) or did_work
+            snapshots.put(analysis)  # re-measure: summaries, the check or a timeline may have been added
+        elif keyword:
+            st.info("Press the 'Analyze News' button to see results.")
+
+        # Plain reruns (toggling the sidebar, paging back) only re-render; timing
+        # or exporting them would bury the runs that fetched or called Groq.
+        if not did_work:
+            run.discard()
+
+    if did_work:
+        st.session_state["last_run"] = run
+    render_debug_sidebar(st.session_state.get("last_run"), snapshots)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,100 @@
+# ai_news_verifier_app/benchmarks/bench_charts.py
+"""Memory and speed of the chart layer over many distinct queries.
+
+    python benchmarks/bench_charts.py [--queries 500] [--articles 30] [--backend matplotlib]
+
+Renders the polarity and distribution charts for `queries` different
+sentiment vectors and prints process RSS as it goes, next to the old way
+(two pyplot figures per query, never closed). RSS should level off for
+the chart module once its cache is full; the old way keeps climbing.
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import charts  # noqa: E402
+
+
+def rss_mib() -> float:
+    """Current resident set size (Linux); peak RSS elsewhere."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    import resource
+
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def old_render(polarities: np.ndarray, counts: dict) -> None:
+    # What app.py used to do per query: two pyplot figures, left open.
+    import io
+
+    import matplotlib
+
+    matplotlib.use("Agg")
+    matplotlib.rcParams["figure.max_open_warning"] = 0  # the leak is the point here
+    import matplotlib.pyplot as plt
+    from matplotlib import colormaps
+
+    fig, ax = plt.subplots(figsize=(5, 4))
+    cmap = colormaps["RdYlGn"]
+    ax.bar(range(len(polarities)), polarities, color=[cmap((s + 1) / 2) for s in polarities])
+    fig.savefig(io.BytesIO(), format="png")
+    pie_fig, pie_ax = plt.subplots(figsize=(5, 4))
+    pie_ax.pie(list(counts.values()), labels=list(counts), autopct="%1.1f%%")
+    pie_fig.savefig(io.BytesIO(), format="png")
+
+
+def new_render(polarities: np.ndarray, counts: dict, backend: str) -> None:
+    charts.polarity_chart(polarities, backend=backend)
+    charts.distribution_chart(counts, backend=backend)
+
+
+def run(label: str, render, queries: int, articles: int, distinct: int = 0) -> None:
+    """Render `queries` times, cycling through `distinct` vectors (0: all different)."""
+    rng = np.random.default_rng(7)
+    pool = [np.round(rng.uniform(-1, 1, articles), 7) for _ in range(distinct)]
+    checkpoints = {max(1, queries * k // 5) for k in range(1, 6)}
+    start = time.perf_counter()
+    print(f"{label}: start RSS {rss_mib():.0f} MiB")
+    for q in range(1, queries + 1):
+        polarities = pool[q % distinct] if pool else np.round(rng.uniform(-1, 1, articles), 7)
+        counts = {
+            "Positive": int((polarities > 0.1).sum()),
+            "Neutral": int((np.abs(polarities) <= 0.1).sum()),
+            "Negative": int((polarities < -0.1).sum()),
+        }
+        render(polarities, counts)
+        if q in checkpoints:
+            elapsed = time.perf_counter() - start
+            print(f"  {q:>6} queries  RSS {rss_mib():>7.0f} MiB  {elapsed / q * 1000:>6.1f} ms/query")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--articles", type=int, default=30)
+    parser.add_argument("--backend", choices=["matplotlib", "vega"], default="matplotlib")
+    parser.add_argument("--skip-old", action="store_true", help="only run the chart module")
+    args = parser.parse_args()
+
+    run(f"charts ({args.backend})", lambda p, c: new_render(p, c, args.backend), args.queries, args.articles)
+    # A working set that fits the cache: after the first pass everything is a hit.
+    distinct = max(1, charts.CHART_CACHE_MAX_ENTRIES // 4)
+    run(f"charts, {distinct} repeating queries", lambda p, c: new_render(p, c, args.backend),
+        args.queries, args.articles, distinct)
+    if not args.skip_old:
+        run("old pyplot, unclosed", old_render, args.queries, args.articles)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+# ai_news_verifier_app/benchmarks/bench_crisis_keywords.py
+"""Micro-benchmark: compiled crisis matcher vs. the old per-keyword substring scan.
+
+    python benchmarks/bench_crisis_keywords.py [headline_count]
+
+Exits non-zero if any NEGATIVE headline matches or any INFLECTED word does not.
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from crisis import CRISIS_KEYWORDS, find_crisis_keywords, has_crisis_keyword  # noqa: E402
+
+FILLER = (
+    "markets rally as tech giants report record quarterly earnings while "
+    "investors weigh central bank guidance on interest rates and software "
+    "firefox update ships new features for developers across the region"
+).split()
+
+# Inflected crisis words the matcher must still catch, as the substring scan did.
+INFLECTED = "killing terrorism flooded crashed bombed attackers kidnapping warfare".split()
+
+# Headlines that share letters with a keyword but are not about a crisis.
+NEGATIVE = [
+    "Online store sells wares",
+    "Tesla fires CEO",
+    "The stormer",
+    "New software release for developers",
+    "Firefox update ships",
+    "Warfarees warism warer criticalism",
+]
+
+
+def make_headlines(count: int, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    headlines = []
+    for _ in range(count):
+        words = rng.choices(FILLER, k=rng.randint(8, 20))
+        if rng.random() < 0.3:  # roughly a third of headlines mention a crisis
+            words.insert(rng.randrange(len(words)), rng.choice(CRISIS_KEYWORDS + INFLECTED))
+        headlines.append(" ".join(words).capitalize())
+    return headlines
+
+
+def substring_scan(text: str) -> bool:
+    lower_text = text.lower()
+    return any(word in lower_text for word in CRISIS_KEYWORDS)
+
+
+def bench(name: str, fn, headlines: list) -> float:
+    start = time.perf_counter()
+    hits = sum(1 for h in headlines if fn(h))
+    elapsed = time.perf_counter() - start
+    print(f"{name:<18} {len(headlines) / elapsed:>12,.0f} headlines/s   {hits:>7} hits   {elapsed:.3f}s")
+    return elapsed
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    headlines = make_headlines(count)
+    print(f"{count:,} synthetic headlines, {len(set(CRISIS_KEYWORDS))} keywords")
+    old = bench("substring scan", substring_scan, headlines)
+    new = bench("compiled matcher", has_crisis_keyword, headlines)
+    bench("find keywords", find_crisis_keywords, headlines)
+    print(f"speedup: {old / new:.1f}x")
+    # Where the two disagree. Substring-only hits should all be false positives
+    # (a keyword inside "software" or "firefox"), never a real crisis word the
+    # matcher lost; matcher-only hits should be none.
+    crisis_words = set(INFLECTED) | {kw.lower() for kw in CRISIS_KEYWORDS}
+    old_only = [h for h in headlines if substring_scan(h) and not has_crisis_keyword(h)]
+    new_only = [h for h in headlines if has_crisis_keyword(h) and not substring_scan(h)]
+    lost = [h for h in old_only if any(kw in h.lower() for kw in crisis_words if " " in kw)
+            or crisis_words & set(h.lower().split())]
+    print(f"substring-only hits: {len(old_only)} (real crisis words among them: {len(lost)}), "
+          f"matcher-only hits: {len(new_only)}")
+
+    false_hits = [h for h in NEGATIVE if has_crisis_keyword(h) or find_crisis_keywords(h)]
+    missed = [w for w in INFLECTED if not has_crisis_keyword(w) or not find_crisis_keywords(w)]
+    print(f"negative headlines matched: {len(false_hits)} / {len(NEGATIVE)}")
+    print(f"inflected words missed:     {len(missed)} / {len(INFLECTED)}")
+    for text in false_hits + missed:
+        print(f"  {text!r}")
+    sys.exit(1 if false_hits or missed else 0)
+
+
+if __name__ == "__main__":
+    main()
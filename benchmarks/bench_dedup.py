@@ -0,0 +1,92 @@
+# ai_news_verifier_app/benchmarks/bench_dedup.py
+"""Near-duplicate clustering: accuracy on headline pairs, then speed.
+
+    python benchmarks/bench_dedup.py
+    python benchmarks/bench_dedup.py --articles 1000 5000
+
+Accuracy cases, built from one template per company:
+
+    different  same template, different company or a changed fact      (must stay apart)
+    repost     the same story reworded the way wire copies are           (must merge)
+
+Every pair is clustered on its own, without shared URLs, and the script
+exits non-zero if any pair comes out wrong. The speed rows cluster N
+synthetic headlines, about a third of them reposts.
+"""
+import argparse
+import itertools
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from mock_servers import WORDS  # noqa: E402
+
+COMPANIES = ["Apple", "Microsoft", "Google", "Amazon", "Nvidia", "Tesla", "Meta", "Intel", "Netflix", "Oracle"]
+TEMPLATE = "{} stock rises 3% after strong earnings beat"
+REPOSTS = [
+    "{} stock rises 3% after strong earnings beat expectations",
+    "{} shares rise 3% after strong earnings beat - Reuters",
+    "{} stock rises 3 percent after strong earnings beat",
+    "{} Stock Rises 3% After Strong Earnings Beat",
+]
+CHANGED_FACTS = [
+    "{} stock falls 3% after strong earnings beat",
+    "{} stock rises 5% after strong earnings beat",
+]
+
+
+def article(title: str, i: int):
+    from pipeline import Article
+
+    return Article("newsapi", title, "", f"https://example.com/{i}")
+
+
+def merged(a: str, b: str) -> bool:
+    import dedup
+
+    return len(dedup.cluster([article(a, 0), article(b, 1)])) == 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--articles", type=int, nargs="+", default=[1000, 5000])
+    args = parser.parse_args()
+
+    import dedup
+
+    different = [(TEMPLATE.format(a), TEMPLATE.format(b)) for a, b in itertools.combinations(COMPANIES, 2)]
+    different += [(TEMPLATE.format(c), fact.format(c)) for c in COMPANIES for fact in CHANGED_FACTS]
+    reposts = [(TEMPLATE.format(c), repost.format(c)) for c in COMPANIES for repost in REPOSTS]
+
+    false_merges = [pair for pair in different if merged(*pair)]
+    missed = [pair for pair in reposts if not merged(*pair)]
+    print(f"different stories merged: {len(false_merges)} / {len(different)}")
+    print(f"reposts missed:           {len(missed)} / {len(reposts)}")
+    for a, b in false_merges + missed:
+        print(f"  {a!r} vs {b!r}")
+
+    print()
+    print(f"{'articles':>8} {'ms':>8} {'clusters':>9}")
+    rng = random.Random(7)
+    for count in args.articles:
+        titles = []
+        for i in range(count):
+            if titles and rng.random() < 0.33:
+                titles.append(rng.choice(titles) + " - Reuters")
+            else:
+                words = (f"{rng.choice(WORDS)}{rng.randrange(100)}" for _ in range(8))  # ~4k-word vocabulary
+                titles.append(" ".join(words) + f" {rng.choice(COMPANIES)}")
+        articles = [article(title, i) for i, title in enumerate(titles)]
+        start = time.perf_counter()
+        clusters = dedup.cluster(articles)
+        print(f"{count:>8} {(time.perf_counter() - start) * 1000:>8.1f} {len(clusters):>9}")
+
+    sys.exit(1 if false_merges or missed else 0)
+
+
+if __name__ == "__main__":
+    main()
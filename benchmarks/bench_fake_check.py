@@ -0,0 +1,101 @@
+# ai_news_verifier_app/benchmarks/bench_fake_check.py
+"""Time to first token of the fake-news check as the headline set grows.
+
+    python benchmarks/bench_fake_check.py
+    python benchmarks/bench_fake_check.py --headlines 30 300 3000 --token-ms 10 --context-tokens 8192
+
+For each headline count, against the mock Groq endpoint with empty caches:
+
+    blocking   one prompt with every headline, answer returned in one piece
+    streamed   token-budgeted chunks checked in parallel, final merge streamed
+
+Reports time to first visible text, total time, Groq calls and the largest
+prompt sent (estimated tokens). The mock charges --prefill-us per prompt
+token and rejects prompts over --context-tokens, like a real model would.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_pipeline import configure_environment  # noqa: E402
+from mock_servers import MockConfig, WORDS, start_mock_server  # noqa: E402
+
+
+def headlines(count: int):
+    return [" ".join(WORDS[(i * 7 + j) % len(WORDS)] for j in range(9)) + f" {i}" for i in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--headlines", type=int, nargs="+", default=[30, 300, 3000])
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--token-ms", type=float, default=10.0, help="mock generation time per word")
+    parser.add_argument("--prefill-us", type=float, default=50.0, help="mock reading time per prompt token")
+    parser.add_argument("--context-tokens", type=int, default=8192, help="mock context window")
+    parser.add_argument("--answer-words", type=int, default=150)
+    args = parser.parse_args()
+
+    server = start_mock_server(MockConfig(
+        latency_ms=args.latency_ms, jitter_ms=0, token_ms=args.token_ms, summary_words=args.answer_words,
+        prefill_us=args.prefill_us, context_tokens=args.context_tokens,
+    ))
+    configure_environment(server.base_url, tempfile.mkdtemp(prefix="news-bench-"))
+
+    import llm
+    from cache import llm_cache
+
+    largest = []
+    real_chat, real_stream = llm.chat, llm.chat_stream
+
+    def chat(kind, prompt, tokens, **kwargs):
+        largest.append(llm.estimate_tokens(prompt))
+        return real_chat(kind, prompt, tokens, **kwargs)
+
+    def chat_stream(kind, prompt, tokens, **kwargs):
+        largest.append(llm.estimate_tokens(prompt))
+        return real_stream(kind, prompt, tokens, **kwargs)
+
+    llm.chat, llm.chat_stream = chat, chat_stream
+    llm.get_client()  # keep the one-off groq import out of the first row
+
+    header = f"{'headlines':>9} {'mode':<9} {'first ms':>9} {'total ms':>9} {'calls':>6} {'max prompt tok':>15}"
+    print(header)
+    print("-" * len(header))
+    chunk_budget = llm.FAKE_CHECK_CHUNK_TOKENS
+    for count in args.headlines:
+        news = "\n".join(headlines(count))
+        for mode in ("blocking", "streamed"):
+            llm_cache.clear()
+            server.reset_counts()
+            largest.clear()
+            first = []
+
+            def on_text(text: str) -> None:
+                if not first:
+                    first.append(time.perf_counter())
+
+            # Blocking is the old behavior: no chunking, no streaming.
+            llm.FAKE_CHECK_CHUNK_TOKENS = 10 ** 9 if mode == "blocking" else chunk_budget
+            start = time.perf_counter()
+            try:
+                llm.fake_check(news, on_text=on_text if mode == "streamed" else None)
+            except Exception as e:
+                print(f"{count:>9} {mode:<9} failed: {type(e).__name__} ({max(largest)} prompt tokens)")
+                continue
+            end = time.perf_counter()
+            first_ms = ((first[0] if first else end) - start) * 1000
+            print(
+                f"{count:>9} {mode:<9} {first_ms:>9.0f} {(end - start) * 1000:>9.0f} "
+                f"{server.counts['groq']:>6} {max(largest):>15}"
+            )
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+# ai_news_verifier_app/benchmarks/bench_import_time.py
+"""Cold import time of the app's modules, each in a fresh interpreter.
+
+    python benchmarks/bench_import_time.py
+    python benchmarks/bench_import_time.py analysis cli --repeat 10 --max-ms 400
+
+For every module reports the median cumulative import time from
+`python -X importtime`, and which heavy third-party packages that import
+dragged in. With --max-ms the script exits non-zero when any module's
+median goes over the budget, so CI can track startup regressions.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODULES = ["app", "analysis", "cli", "pipeline", "llm", "sentiment", "fetchers"]
+
+# Packages worth knowing about when they load at import time.
+HEAVY = ["streamlit", "matplotlib", "pandas", "groq", "textblob", "nltk", "numpy", "requests"]
+
+PROBE = (
+    "import sys, {module}; "
+    "print(','.join(p for p in {heavy!r} if p in sys.modules))"
+)
+
+
+def measure(module: str):
+    """(cumulative import ms, heavy packages loaded) for one fresh import of `module`."""
+    env = dict(os.environ, GROQ_API_KEY=os.environ.get("GROQ_API_KEY", "bench"))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE.format(module=module, heavy=HEAVY)],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True,
+    )
+    cumulative_us = 0
+    for line in proc.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if name.rstrip() == f" {module}":  # top level, not a nested import
+            cumulative_us = int(cumulative)
+    loaded = [p for p in proc.stdout.strip().split(",") if p]
+    return cumulative_us / 1000, loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("modules", nargs="*", default=MODULES)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--max-ms", type=float, default=None, help="fail when a median exceeds this")
+    args = parser.parse_args()
+
+    header = f"{'module':<10} {'median ms':>10} {'min ms':>8}  heavy packages loaded"
+    print(header)
+    print("-" * len(header))
+    over = []
+    for module in args.modules:
+        runs = [measure(module) for _ in range(args.repeat)]
+        times = [ms for ms, _ in runs]
+        median = statistics.median(times)
+        print(f"{module:<10} {median:>10.1f} {min(times):>8.1f}  {', '.join(runs[-1][1]) or '-'}")
+        if args.max_ms is not None and median > args.max_ms:
+            over.append(module)
+
+    if over:
+        print(f"\nover the {args.max_ms:.0f} ms budget: {', '.join(over)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+# ai_news_verifier_app/benchmarks/bench_local_sources.py
+"""Ingest rate of the local RSS and JSONL source adapters.
+
+    python benchmarks/bench_local_sources.py
+    python benchmarks/bench_local_sources.py --items 10000 100000 --match-every 10
+
+For each corpus size, writes one RSS file and one JSONL dump of that many
+items into a temp folder (every --match-every-th item mentions the query),
+then reports, per format:
+
+    fetch   one fan-out fetch_all over the last 7 days
+    walk    a full sentiment timeline walk over 31 days, scored page by page
+
+with items read per second (timed untraced) and peak traced memory. Memory should not grow
+with the file size, since files are streamed rather than loaded.
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from xml.sax.saxutils import escape
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_pipeline import configure_environment  # noqa: E402
+from mock_servers import WORDS  # noqa: E402
+
+QUERY = "bench topic"
+
+
+def _item(i: int, count: int, match_every: int, now: datetime):
+    words = " ".join(WORDS[(i * 7 + j) % len(WORDS)] for j in range(8))
+    title = f"{QUERY} {words} {i}" if i % match_every == 0 else f"{words} {i}"
+    # Spread over 40 days, newest first, so part of each file falls outside the window.
+    published = now - timedelta(minutes=i * 40 * 1440 // count)
+    return title, f"{words} {words}", f"https://local.example/{i}", published
+
+
+def write_corpus(folder: str, count: int, match_every: int):
+    now = datetime.now(timezone.utc)
+    rss, jsonl = os.path.join(folder, f"corpus-{count}.rss"), os.path.join(folder, f"corpus-{count}.jsonl")
+    with open(rss, "w", encoding="utf-8") as r, open(jsonl, "w", encoding="utf-8") as j:
+        r.write('<?xml version="1.0"?><rss version="2.0"><channel><title>bench</title>\n')
+        for i in range(count):
+            title, description, url, published = _item(i, count, match_every, now)
+            r.write(
+                f"<item><title>{escape(title)}</title><description>{escape(description)}</description>"
+                f"<link>{url}</link><pubDate>{format_datetime(published)}</pubDate></item>\n"
+            )
+            j.write(json.dumps({
+                "title": title, "description": description, "url": url,
+                "published": published.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            }) + "\n")
+        r.write("</channel></rss>\n")
+    return {"rss": rss, "jsonl": jsonl}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, nargs="+", default=[10000, 50000], help="items per file")
+    parser.add_argument("--match-every", type=int, default=10, help="one item in N mentions the query")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="news-bench-")
+    # No upstream APIs here: each row registers only the local adapter under test.
+    configure_environment("http://127.0.0.1:9", workdir)
+
+    import sources
+    import timeline
+
+    header = f"{'items':>8} {'format':<6} {'mode':<6} {'seconds':>8} {'items/s':>10} {'matched':>8} {'peak MiB':>9}"
+    print(header)
+    print("-" * len(header))
+    for count in args.items:
+        files = write_corpus(workdir, count, args.match_every)
+        for fmt, adapter_class in (("rss", sources.RSSAdapter), ("jsonl", sources.JSONLAdapter)):
+            sources.SOURCES.clear()
+            sources.register(adapter_class(fmt, [files[fmt]], budget=10 ** 9))
+            for mode in ("fetch", "walk"):
+                def run():
+                    if mode == "fetch":
+                        results, errors = sources.fetch_all(QUERY, 7)
+                        return errors, len(results[fmt])
+                    result = timeline.sentiment_timeline(QUERY, 31, budget=10 ** 9)
+                    return result["errors"], result["article_count"]
+
+                # Timed and traced separately: tracemalloc alone slows parsing several-fold.
+                start = time.perf_counter()
+                errors, matched = run()
+                elapsed = time.perf_counter() - start
+                tracemalloc.start()
+                run()
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                print(
+                    f"{count:>8} {fmt:<6} {mode:<6} {elapsed:>8.2f} {count / elapsed:>10.0f} "
+                    f"{matched:>8} {peak / 2**20:>9.1f}"
+                )
+                if errors:
+                    print(f"  errors: {errors}")
+
+
+if __name__ == "__main__":
+    main()
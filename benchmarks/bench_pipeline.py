@@ -0,0 +1,130 @@
+# ai_news_verifier_app/benchmarks/bench_pipeline.py
+"""End-to-end benchmark of analysis.analyze_topic against local mock upstreams.
+
+    python benchmarks/bench_pipeline.py
+    python benchmarks/bench_pipeline.py --articles 10 30 100 --workers 1 4 8 \\
+        --repeat 5 --latency-ms 80 --jitter-ms 30 --error-rate 0.05
+    python benchmarks/bench_pipeline.py --users 20   # 20 sessions, same topic, same moment
+
+Every run starts with empty LLM and HTTP caches and an empty article store,
+so it measures the full fetch -> dedup -> score -> summarize -> fake-check
+path. Reports p50/p95 latency, upstream request counts (and 429s) per run,
+and peak traced memory. With --users N, each run is N concurrent identical queries; latency is the
+slowest of them and request counts show how much single-flight shared.
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from mock_servers import MockConfig, start_mock_server  # noqa: E402
+
+
+def percentile(values, q: float) -> float:
+    ordered = sorted(values)
+    k = (len(ordered) - 1) * q
+    lo, hi = int(k), min(int(k) + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (k - lo)
+
+
+def configure_environment(base_url: str, workdir: str) -> None:
+    """Point the app at the mocks; must run before the app modules are imported."""
+    os.environ.update({
+        "NEWSAPI_URL": f"{base_url}/v2/everything",
+        "POLYGON_URL": f"{base_url}/v2/reference/news",
+        "GROQ_BASE_URL": base_url,
+        "GROQ_API_KEY": "bench",
+        "NEWS_API_KEY": "bench",
+        "POLYGON_API_KEY": "bench",
+        "LLM_CACHE_PATH": os.path.join(workdir, "llm_cache.sqlite3"),
+        "HTTP_CACHE_PATH": os.path.join(workdir, "http_cache.sqlite3"),
+        "ARTICLE_STORE_PATH": os.path.join(workdir, "articles.sqlite3"),
+        # The mocks only throttle when told to; don't let our own limiter dominate.
+        "GROQ_REQUESTS_PER_MINUTE": os.environ.get("GROQ_REQUESTS_PER_MINUTE", "1000000"),
+        "GROQ_TOKENS_PER_MINUTE": os.environ.get("GROQ_TOKENS_PER_MINUTE", "1000000000"),
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--articles", type=int, nargs="+", default=[10, 30, 100],
+                        help="articles per topic (split evenly across the two sources)")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8],
+                        help="GROQ_MAX_WORKERS values to try")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--jitter-ms", type=float, default=20.0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of upstream requests answered 429")
+    parser.add_argument("--description-words", type=int, default=40)
+    parser.add_argument("--summary-words", type=int, default=40)
+    parser.add_argument("--users", type=int, default=1, help="concurrent identical queries per run")
+    args = parser.parse_args()
+
+    server = start_mock_server(MockConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        description_words=args.description_words,
+        summary_words=args.summary_words,
+    ))
+    workdir = tempfile.mkdtemp(prefix="news-bench-")
+    configure_environment(server.base_url, workdir)
+
+    import llm
+    from analysis import analyze_topic
+    from cache import http_cache, llm_cache
+    from store import article_store
+
+    print(f"mock upstreams at {server.base_url}: latency {args.latency_ms:.0f}±{args.jitter_ms:.0f} ms, "
+          f"429 rate {args.error_rate:.0%}, {args.repeat} runs per row, {args.users} user(s) per run\n")
+    header = f"{'articles':>8} {'workers':>7} {'p50 ms':>9} {'p95 ms':>9} {'news':>6} {'poly':>6} {'groq':>6} {'429s':>6} {'peak MiB':>9}"
+    print(header)
+    print("-" * len(header))
+
+    for count in args.articles:
+        per_source = max(1, count // 2)
+        server.config.articles = per_source
+        for workers in args.workers:
+            llm.GROQ_MAX_WORKERS = workers
+            latencies = []
+            server.reset_counts()
+            tracemalloc.start()
+            for run in range(args.repeat):
+                llm_cache.clear()
+                http_cache.clear()
+                article_store.clear()
+                users = [
+                    threading.Thread(target=analyze_topic, args=(f"bench topic {run}", 3, per_source))
+                    for _ in range(args.users)
+                ]
+                start = time.perf_counter()
+                for user in users:
+                    user.start()
+                for user in users:
+                    user.join()
+                latencies.append((time.perf_counter() - start) * 1000)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            counts = server.counts
+            throttled = sum(v for k, v in counts.items() if k.endswith(":429"))
+            print(
+                f"{count:>8} {workers:>7} "
+                f"{statistics.median(latencies):>9.1f} {percentile(latencies, 0.95):>9.1f} "
+                f"{counts['newsapi'] / args.repeat:>6.1f} {counts['polygon'] / args.repeat:>6.1f} "
+                f"{counts['groq'] / args.repeat:>6.1f} {throttled / args.repeat:>6.1f} "
+                f"{peak / 2**20:>9.1f}"
+            )
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
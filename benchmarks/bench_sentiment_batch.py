@@ -0,0 +1,64 @@
+# ai_news_verifier_app/benchmarks/bench_sentiment_batch.py
+"""Throughput and agreement of analyze_sentiment_batch vs. per-text TextBlob.
+
+    python benchmarks/bench_sentiment_batch.py [text_count]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sentiment import (  # noqa: E402
+    SENTIMENT_BATCH_TOLERANCE,
+    _get_lexicon,
+    analyze_sentiment,
+    analyze_sentiment_batch,
+    label_sentiment,
+)
+
+FILLER = (
+    "the a of to in is on at by market report city officials said new plan "
+    "very really , . ; : -- ! not no never don't :)"
+).split()
+
+
+def make_texts(count: int, seed: int = 11) -> list:
+    """Random headline-length texts mixing lexicon words, adverbs and filler."""
+    rng = random.Random(seed)
+    lex = _get_lexicon()
+    vocab = list(lex.index)
+    adverbs = [w for w, i in lex.index.items() if lex.modifier[i]]
+    texts = []
+    for _ in range(count):
+        words = []
+        for _ in range(rng.randint(6, 30)):
+            r = rng.random()
+            words.append(rng.choice(vocab) if r < 0.25 else rng.choice(adverbs) if r < 0.35 else rng.choice(FILLER))
+        texts.append(" ".join(words).capitalize())
+    return texts
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    texts = make_texts(count)
+
+    start = time.perf_counter()
+    expected = [analyze_sentiment(t) for t in texts]
+    single = time.perf_counter() - start
+
+    start = time.perf_counter()
+    got = analyze_sentiment_batch(texts)
+    batch = time.perf_counter() - start
+
+    worst = max(abs(a - b) for a, b in zip(expected, got))
+    label_drift = sum(label_sentiment(a, t) != label_sentiment(b, t) for a, b, t in zip(expected, got, texts))
+    print(f"{count:,} texts")
+    print(f"TextBlob per text   {count / single:>10,.0f} texts/s   {single:.2f}s")
+    print(f"batch               {count / batch:>10,.0f} texts/s   {batch:.2f}s")
+    print(f"max |diff| {worst:.1e} (tolerance {SENTIMENT_BATCH_TOLERANCE:.0e}), label changes: {label_drift}")
+
+
+if __name__ == "__main__":
+    main()
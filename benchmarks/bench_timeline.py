@@ -0,0 +1,68 @@
+# ai_news_verifier_app/benchmarks/bench_timeline.py
+"""Paginated sentiment timeline against the local mock upstreams.
+
+    python benchmarks/bench_timeline.py
+    python benchmarks/bench_timeline.py --articles 500 2000 8000 --latency-ms 20
+
+Each row walks every page for one query with empty caches and reports wall
+time, pages requested, articles scored, and peak traced memory. Peak memory
+should stay roughly flat as the article count grows.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_pipeline import configure_environment  # noqa: E402
+from mock_servers import MockConfig, start_mock_server  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--articles", type=int, nargs="+", default=[500, 2000, 8000],
+                        help="articles available per source")
+    parser.add_argument("--budget", type=int, default=None, help="FETCH_ARTICLE_BUDGET (default: no cap)")
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--description-words", type=int, default=40)
+    args = parser.parse_args()
+
+    server = start_mock_server(MockConfig(
+        latency_ms=args.latency_ms, jitter_ms=0, description_words=args.description_words,
+    ))
+    workdir = tempfile.mkdtemp(prefix="news-bench-")
+    configure_environment(server.base_url, workdir)
+
+    from cache import http_cache
+    from timeline import sentiment_timeline
+
+    header = f"{'per source':>10} {'seconds':>8} {'news pages':>10} {'poly pages':>10} {'scored':>7} {'days':>5} {'peak MiB':>9}"
+    print(header)
+    print("-" * len(header))
+    for count in args.articles:
+        server.config.total_articles = count
+        server.reset_counts()
+        http_cache.clear()
+        budget = args.budget or 2 * max(args.articles)
+        tracemalloc.start()
+        start = time.perf_counter()
+        result = sentiment_timeline(f"bench {count}", 31, budget=budget)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(
+            f"{count:>10} {elapsed:>8.2f} {server.counts['newsapi']:>10} {server.counts['polygon']:>10} "
+            f"{result['article_count']:>7} {len(result['buckets']):>5} {peak / 2**20:>9.1f}"
+        )
+        if result["errors"]:
+            print(f"  errors: {result['errors']}")
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,298 @@
+# ai_news_verifier_app/benchmarks/mock_servers.py
+"""Local stand-ins for NewsAPI, Polygon and Groq chat completions.
+
+One threaded HTTP server answers all three:
+
+    GET  /v2/everything                  NewsAPI-shaped {"articles": [...]}
+    GET  /v2/reference/news              Polygon-shaped {"results": [...]}
+    POST /openai/v1/chat/completions     Groq/OpenAI-shaped chat completion
+                                         (server-sent events with "stream": true)
+
+Latency, jitter, the share of 429 answers and payload sizes come from
+MockConfig. Every request is counted per endpoint. With total_articles set,
+the news endpoints paginate like the real ones: NewsAPI by page/pageSize
+with totalResults, Polygon by limit with a next_url cursor. Article i is
+dated i hours ago, and the from/to (NewsAPI) and published_utc.gte/.lt
+(Polygon) filters are applied.
+"""
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Tuple
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+WORDS = (
+    "market rally tech earnings growth city council plan river storm rescue "
+    "election vote court ruling climate summit energy prices bank rates jobs "
+    "report health vaccine school budget crash fire flood attack record strong "
+    "good great weak poor hopeful worried surprising steady"
+).split()
+
+
+class MockConfig:
+    __slots__ = (
+        "latency_ms", "jitter_ms", "error_rate", "articles", "total_articles",
+        "description_words", "summary_words", "token_ms", "prefill_us", "context_tokens", "seed",
+    )
+
+    def __init__(
+        self,
+        latency_ms: float = 50.0,
+        jitter_ms: float = 20.0,
+        error_rate: float = 0.0,
+        articles: int = 30,
+        total_articles: Optional[int] = None,
+        description_words: int = 40,
+        summary_words: int = 40,
+        token_ms: float = 0.0,
+        prefill_us: float = 0.0,
+        context_tokens: Optional[int] = None,
+        seed: int = 1,
+    ):
+        self.latency_ms = latency_ms          # mean added delay per request
+        self.jitter_ms = jitter_ms            # +/- uniform jitter on top
+        self.error_rate = error_rate          # share of requests answered 429
+        self.articles = articles              # items per NewsAPI / Polygon response
+        self.total_articles = total_articles  # paginate over this many when set
+        self.description_words = description_words
+        self.summary_words = summary_words    # words per generated summary
+        self.token_ms = token_ms              # generation time per completion word
+        self.prefill_us = prefill_us          # reading time per prompt token
+        self.context_tokens = context_tokens  # longer prompts are rejected with 400
+        self.seed = seed
+
+
+class MockNewsServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, config: MockConfig):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.config = config
+        self.counts: Counter = Counter()
+        self.lock = threading.Lock()
+        self.rng = random.Random(config.seed)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def count(self, key: str) -> None:
+        with self.lock:
+            self.counts[key] += 1
+
+    def reset_counts(self) -> None:
+        with self.lock:
+            self.counts.clear()
+
+    def roll(self) -> Tuple[float, bool]:
+        """(delay seconds, answer 429?) for one request."""
+        cfg = self.config
+        with self.lock:
+            delay = cfg.latency_ms + self.rng.uniform(-cfg.jitter_ms, cfg.jitter_ms)
+            throttle = self.rng.random() < cfg.error_rate
+        return max(0.0, delay) / 1000.0, throttle
+
+
+def _published(i: int, minute: int) -> str:
+    # Article i is i hours old (wrapping at 28 days), so every look-back window has items.
+    now = datetime.now(timezone.utc).replace(minute=minute, second=0, microsecond=0)
+    return (now - timedelta(hours=i % (24 * 28))).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _in_range(published: str, since: Optional[str], until: Optional[str], until_inclusive: bool) -> bool:
+    """Published-time filter the real APIs apply for from/to and gte/lt."""
+    if since and published[:len(since)] < since:
+        return False
+    if until:
+        head = published[:len(until)]
+        return head <= until if until_inclusive else head < until
+    return True
+
+
+def _sentence(rng: random.Random, n: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(n)).capitalize()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: MockNewsServer
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):  # keep benchmark output clean
+        pass
+
+    def _send_json(self, status: int, body: dict, headers: Optional[dict] = None) -> None:
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _throttled(self, endpoint: str) -> bool:
+        delay, throttle = self.server.roll()
+        time.sleep(delay)
+        if throttle:
+            self.server.count(f"{endpoint}:429")
+            self._send_json(429, {"error": {"message": "rate limited"}}, {"Retry-After": "0"})
+            return True
+        return False
+
+    def _window(self, query: dict, size_param: str, offset: int) -> Tuple[int, int, int]:
+        """(first index, item count, total) for one page of this request."""
+        cfg = self.server.config
+        if cfg.total_articles is None:
+            return 0, cfg.articles, cfg.articles
+        size = int(query.get(size_param) or cfg.articles)
+        return offset, max(0, min(size, cfg.total_articles - offset)), cfg.total_articles
+
+    def _articles(self, query: dict, seed_key: str, start: int, count: int):
+        cfg = self.server.config
+        # Seeded by the query minus paging, so every page of one query is one stream.
+        stable = sorted((k, v) for k, v in query.items() if k not in ("page", "pageSize", "limit", "cursor"))
+        for i in range(start, start + count):
+            rng = random.Random(f"{cfg.seed}:{seed_key}:{stable}:{i}")
+            yield i, _sentence(rng, rng.randint(6, 14)), _sentence(rng, cfg.description_words)
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        query = {k: v[0] for k, v in parse_qs(parts.query).items()}
+        if parts.path == "/v2/everything":
+            self.server.count("newsapi")
+            if self._throttled("newsapi"):
+                return
+            page_size = int(query.get("pageSize") or 0) or self.server.config.articles
+            start, count, total = self._window(query, "pageSize", (int(query.get("page", 1)) - 1) * page_size)
+            articles = [
+                {
+                    "title": title,
+                    "description": desc,
+                    "url": f"https://news.example/{i}",
+                    "publishedAt": _published(i, 0),
+                }
+                for i, title, desc in self._articles(query, "n", start, count)
+            ]
+            articles = [
+                a for a in articles if _in_range(a["publishedAt"], query.get("from"), query.get("to"), True)
+            ]
+            self._send_json(200, {"status": "ok", "totalResults": total, "articles": articles})
+        elif parts.path == "/v2/reference/news":
+            self.server.count("polygon")
+            if self._throttled("polygon"):
+                return
+            start, count, total = self._window(query, "limit", int(query.get("cursor", 0)))
+            results = [
+                {
+                    "title": title,
+                    "description": desc,
+                    "article_url": f"https://markets.example/{i}",
+                    "published_utc": _published(i, 30),
+                }
+                for i, title, desc in self._articles(query, "p", start, count)
+            ]
+            results = [
+                r for r in results
+                if _in_range(r["published_utc"], query.get("published_utc.gte"), query.get("published_utc.lt"), False)
+            ]
+            body = {"status": "OK", "count": len(results), "results": results}
+            if start + count < total:
+                rest = {k: v for k, v in query.items() if k not in ("cursor", "apiKey")}
+                body["next_url"] = f"{self.server.base_url}{parts.path}?{urlencode({**rest, 'cursor': start + count})}"
+            self._send_json(200, body)
+        else:
+            self._send_json(404, {"error": "not found"})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        payload = json.loads(self.rfile.read(length) or b"{}")
+        if urlsplit(self.path).path != "/openai/v1/chat/completions":
+            self._send_json(404, {"error": "not found"})
+            return
+        self.server.count("groq")
+        if self._throttled("groq"):
+            return
+
+        prompt = payload["messages"][-1]["content"]
+        rng = random.Random(prompt)
+        words = self.server.config.summary_words
+        numbered = re.findall(r"^\[(\d+)\] ", prompt, re.MULTILINE)
+        if numbered:  # batched summaries want a JSON object keyed by article number
+            content = json.dumps({n: _sentence(rng, words) for n in numbered})
+        else:
+            content = _sentence(rng, words)
+        prompt_tokens = max(1, len(prompt) // 4)
+        completion_tokens = max(1, len(content) // 4)
+        usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        }
+        cfg = self.server.config
+        if cfg.context_tokens is not None and prompt_tokens > cfg.context_tokens:
+            self._send_json(400, {"error": {
+                "message": f"prompt is {prompt_tokens} tokens, context window is {cfg.context_tokens}",
+                "type": "invalid_request_error",
+                "code": "context_length_exceeded",
+            }})
+            return
+        time.sleep(prompt_tokens * cfg.prefill_us / 1e6)
+        if payload.get("stream"):
+            self._stream(payload, content, usage)
+            return
+        # Generation time: a streamed answer spreads this out, a plain one waits for all of it.
+        time.sleep(len(content.split()) * self.server.config.token_ms / 1000.0)
+        self._send_json(200, {
+            "id": "chatcmpl-mock",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": payload.get("model", "mock"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            }],
+            "usage": usage,
+        })
+
+    def _stream(self, payload: dict, content: str, usage: dict) -> None:
+        """Send `content` word by word as chat.completion.chunk events, Groq style."""
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        def event(data: str) -> None:
+            body = f"data: {data}\n\n".encode("utf-8")
+            self.wfile.write(f"{len(body):x}\r\n".encode("ascii") + body + b"\r\n")
+            self.wfile.flush()
+
+        base = {"id": "chatcmpl-mock", "object": "chat.completion.chunk", "created": int(time.time()),
+                "model": payload.get("model", "mock")}
+        words = content.split(" ")
+        for i, word in enumerate(words):
+            time.sleep(self.server.config.token_ms / 1000.0)
+            delta = {"content": word if i == len(words) - 1 else word + " "}
+            if i == 0:
+                delta["role"] = "assistant"
+            event(json.dumps({**base, "choices": [{"index": 0, "delta": delta, "finish_reason": None}]}))
+        event(json.dumps({
+            **base,
+            "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
+            "x_groq": {"id": "req-mock", "usage": usage},
+        }))
+        event("[DONE]")
+        self.wfile.write(b"0\r\n\r\n")
+        self.wfile.flush()
+
+
+def start_mock_server(config: MockConfig) -> MockNewsServer:
+    """Start the mock server on a free local port in a background thread."""
+    server = MockNewsServer(config)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
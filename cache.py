@@ -0,0 +1,233 @@
+# ai_news_verifier_app/cache.py
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, NamedTuple, Optional
+
+# --- CACHE SETTINGS ---
+LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", ".llm_cache.sqlite3")
+LLM_CACHE_TTL = float(os.getenv("LLM_CACHE_TTL", str(7 * 24 * 3600)))  # seconds
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "5000"))
+
+HTTP_CACHE_PATH = os.getenv("HTTP_CACHE_PATH", ".http_cache.sqlite3")
+HTTP_CACHE_TTL = float(os.getenv("HTTP_CACHE_TTL", "120"))  # seconds a response is served without asking upstream
+HTTP_CACHE_MAX_ENTRIES = int(os.getenv("HTTP_CACHE_MAX_ENTRIES", "500"))
+
+# Query parameters that identify the caller, not the query; never part of a cache key.
+SECRET_PARAMS = {"apikey", "api_key", "token"}
+
+
+class LLMCache:
+    """On-disk cache of LLM responses keyed by a hash of (model, prompt).
+
+    Entries expire after `ttl` seconds, and once more than `max_entries` are
+    stored the least recently used ones are evicted. Hits only note their
+    access time in memory; those are written out with the next `set()` (or
+    once ACCESS_FLUSH_EVERY have piled up), so a read never commits. One
+    instance is safe to share between threads.
+    """
+
+    ACCESS_FLUSH_EVERY = 256
+
+    def __init__(self, path: str, ttl: float, max_entries: int):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.accessed: Dict[str, float] = {}  # key -> last hit not yet written
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache ("
+            " key TEXT PRIMARY KEY,"
+            " value TEXT NOT NULL,"
+            " created REAL NOT NULL,"
+            " accessed REAL NOT NULL)"
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS llm_cache_accessed ON llm_cache (accessed)")
+        self.conn.commit()
+
+    @staticmethod
+    def make_key(model: str, prompt: str) -> str:
+        return hashlib.sha256(f"{model}\0{prompt}".encode("utf-8")).hexdigest()
+
+    def get(self, model: str, prompt: str) -> Optional[str]:
+        """Return the cached response, or None on a miss or an expired entry."""
+        key = self.make_key(model, prompt)
+        now = time.time()
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT value, created FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or now - row[1] > self.ttl:
+                if row is not None:
+                    self.accessed.pop(key, None)
+                    self.conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                    self.conn.commit()
+                self.misses += 1
+                return None
+            self.accessed[key] = now
+            if len(self.accessed) >= self.ACCESS_FLUSH_EVERY:
+                self._flush_accessed()
+                self.conn.commit()
+            self.hits += 1
+            return row[0]
+
+    def _flush_accessed(self) -> None:
+        """Write the pending hit times; the caller holds the lock and commits."""
+        if self.accessed:
+            self.conn.executemany(
+                "UPDATE llm_cache SET accessed = ? WHERE key = ?",
+                [(accessed, key) for key, accessed in self.accessed.items()],
+            )
+            self.accessed.clear()
+
+    def set(self, model: str, prompt: str, value: str) -> None:
+        key = self.make_key(model, prompt)
+        now = time.time()
+        with self.lock:
+            self.accessed.pop(key, None)
+            self._flush_accessed()  # eviction below must see recent hits
+            self.conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, created, accessed) VALUES (?, ?, ?, ?)",
+                (key, value, now, now),
+            )
+            overflow = self.conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0] - self.max_entries
+            if overflow > 0:
+                self.conn.execute(
+                    "DELETE FROM llm_cache WHERE key IN "
+                    "(SELECT key FROM llm_cache ORDER BY accessed ASC LIMIT ?)",
+                    (overflow,),
+                )
+            self.conn.commit()
+
+    def stats(self) -> Dict[str, int]:
+        with self.lock:
+            entries = self.conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+        return {"hits": self.hits, "misses": self.misses, "entries": entries}
+
+    def clear(self) -> None:
+        with self.lock:
+            self.accessed.clear()
+            self.conn.execute("DELETE FROM llm_cache")
+            self.conn.commit()
+            self.hits = 0
+            self.misses = 0
+
+
+class CachedResponse(NamedTuple):
+    body: dict
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched: float  # time.time() of the last 200 or 304 from upstream
+
+    def is_fresh(self, ttl: float) -> bool:
+        return time.time() - self.fetched < ttl
+
+
+class ResponseCache:
+    """Two-tier cache of upstream JSON responses.
+
+    An in-process LRU dict is shared by every Streamlit session in the
+    process; a SQLite file behind it survives restarts. Stale entries are
+    kept (up to `max_entries`) because their ETag / Last-Modified validators
+    let the next request revalidate instead of downloading again.
+    """
+
+    def __init__(self, path: str, max_entries: int):
+        self.max_entries = max_entries
+        self.memory: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS http_cache ("
+            " key TEXT PRIMARY KEY,"
+            " body TEXT NOT NULL,"
+            " etag TEXT,"
+            " last_modified TEXT,"
+            " fetched REAL NOT NULL)"
+        )
+        self.conn.commit()
+
+    @staticmethod
+    def make_key(url: str, params: dict) -> str:
+        """Hash of the URL and its normalized query, with API keys left out."""
+        query = sorted(
+            (str(name), str(value))
+            for name, value in params.items()
+            if str(name).lower() not in SECRET_PARAMS and value is not None
+        )
+        return hashlib.sha256(json.dumps([url, query]).encode("utf-8")).hexdigest()
+
+    def _remember(self, key: str, entry: CachedResponse) -> None:
+        self.memory[key] = entry
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.max_entries:
+            self.memory.popitem(last=False)
+
+    def get(self, key: str, in_memory: bool = True) -> Optional[CachedResponse]:
+        """Return the entry for `key` (fresh or stale), or None.
+
+        With in_memory=False a SQLite hit is not promoted into the memory
+        tier; bulk pages use this so they don't crowd out the small hot set.
+        """
+        with self.lock:
+            entry = self.memory.get(key)
+            if entry is not None:
+                self.memory.move_to_end(key)
+                return entry
+            row = self.conn.execute(
+                "SELECT body, etag, last_modified, fetched FROM http_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            entry = CachedResponse(json.loads(row[0]), row[1], row[2], row[3])
+            if in_memory:
+                self._remember(key, entry)
+            return entry
+
+    def set(self, key: str, entry: CachedResponse, in_memory: bool = True) -> None:
+        with self.lock:
+            if in_memory:
+                self._remember(key, entry)
+            self.conn.execute(
+                "INSERT OR REPLACE INTO http_cache (key, body, etag, last_modified, fetched)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (key, json.dumps(entry.body), entry.etag, entry.last_modified, entry.fetched),
+            )
+            overflow = self.conn.execute("SELECT COUNT(*) FROM http_cache").fetchone()[0] - self.max_entries
+            if overflow > 0:
+                self.conn.execute(
+                    "DELETE FROM http_cache WHERE key IN "
+                    "(SELECT key FROM http_cache ORDER BY fetched ASC LIMIT ?)",
+                    (overflow,),
+                )
+            self.conn.commit()
+
+    def touch(self, key: str, entry: CachedResponse, in_memory: bool = True) -> CachedResponse:
+        """Mark `entry` fresh again after upstream answered 304 Not Modified."""
+        refreshed = entry._replace(fetched=time.time())
+        with self.lock:
+            if in_memory:
+                self._remember(key, refreshed)
+            self.conn.execute("UPDATE http_cache SET fetched = ? WHERE key = ?", (refreshed.fetched, key))
+            self.conn.commit()
+        return refreshed
+
+    def clear(self) -> None:
+        with self.lock:
+            self.memory.clear()
+            self.conn.execute("DELETE FROM http_cache")
+            self.conn.commit()
+
+
+# Shared by summaries and the fake-news check.
+llm_cache = LLMCache(LLM_CACHE_PATH, LLM_CACHE_TTL, LLM_CACHE_MAX_ENTRIES)
+
+# Shared by every source fetch in the process.
+http_cache = ResponseCache(HTTP_CACHE_PATH, HTTP_CACHE_MAX_ENTRIES)
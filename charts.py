@@ -0,0 +1,249 @@
+# ai_news_verifier_app/charts.py
+"""Sentiment charts rendered once per distinct data and cached.
+
+    chart = charts.polarity_chart([a.polarity for a in articles])
+    chart = charts.distribution_chart(pipeline.label_counts(articles))
+    chart = charts.timeline_chart(timeline.sentiment_timeline(keyword, days)["buckets"])
+
+Each returns a Chart whose payload is PNG bytes ("matplotlib" backend) or
+a Vega-Lite spec ("vega" backend, no matplotlib at all). Figures are built
+on matplotlib's object API and discarded after saving, so nothing piles up
+in pyplot's global figure registry on a long-running server.
+"""
+import hashlib
+import io
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, List, NamedTuple, Sequence, Union
+
+import numpy as np
+
+CHART_BACKEND = os.getenv("CHART_BACKEND", "matplotlib")  # "matplotlib" or "vega"
+CHART_CACHE_MAX_ENTRIES = int(os.getenv("CHART_CACHE_MAX_ENTRIES", "256"))
+CHART_DPI = 150
+
+LABELS = ("Positive", "Neutral", "Negative")
+LABEL_COLORS = ("#28a745", "#6c757d", "#dc3545")
+BACKGROUND = "#E7F6FF"
+PLOT_BACKGROUND = "#F5FDFF"
+
+
+class Chart(NamedTuple):
+    backend: str
+    payload: Union[bytes, dict]
+
+
+class ChartCache:
+    """Thread-safe in-process LRU of rendered charts, keyed by a hash of their data."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self.memory: "OrderedDict[str, Chart]" = OrderedDict()
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def make_key(backend: str, kind: str, data: bytes) -> str:
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        return f"{backend}:{kind}:{digest}"
+
+    def get(self, key: str):
+        with self.lock:
+            chart = self.memory.get(key)
+            if chart is not None:
+                self.memory.move_to_end(key)
+            return chart
+
+    def set(self, key: str, chart: Chart) -> None:
+        with self.lock:
+            self.memory[key] = chart
+            self.memory.move_to_end(key)
+            while len(self.memory) > self.max_entries:
+                self.memory.popitem(last=False)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.memory.clear()
+
+
+chart_cache = ChartCache(CHART_CACHE_MAX_ENTRIES)
+
+
+def polarity_colors(polarities: np.ndarray) -> np.ndarray:
+    """RGBA rows from the RdYlGn colormap, -1 -> red and +1 -> green, in one call."""
+    from matplotlib import colormaps
+
+    return colormaps["RdYlGn"]((polarities + 1.0) / 2.0)
+
+
+# --- MATPLOTLIB ---
+
+def _new_figure():
+    # Figure + Agg canvas directly, not pyplot: the figure is never registered
+    # globally, so it is freed as soon as the PNG is written.
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(5, 4))
+    FigureCanvasAgg(fig)
+    fig.patch.set_facecolor(BACKGROUND)
+    return fig
+
+
+def _png(fig) -> bytes:
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=CHART_DPI, bbox_inches="tight", facecolor=fig.get_facecolor())
+    fig.clear()
+    return buf.getvalue()
+
+
+def _render_polarity_png(polarities: np.ndarray) -> bytes:
+    fig = _new_figure()
+    ax = fig.add_subplot()
+    ax.set_facecolor(PLOT_BACKGROUND)
+    ax.set_title("Sentiment Polarity", color="black", pad=20)
+    ax.bar(np.arange(len(polarities)), polarities, color=polarity_colors(polarities))
+    ax.set_xlabel("Article Index", color="black")
+    ax.set_ylabel("Polarity (-1 to 1)", color="black")
+    ax.tick_params(axis="x", colors="black")
+    ax.tick_params(axis="y", colors="black")
+    return _png(fig)
+
+
+def _render_distribution_png(values: Sequence[int]) -> bytes:
+    fig = _new_figure()
+    ax = fig.add_subplot()
+    ax.set_facecolor("#111111")
+    if sum(values):  # pie() cannot draw an all-zero distribution
+        ax.pie(values, labels=LABELS, colors=LABEL_COLORS, autopct="%1.1f%%", textprops={"color": "BLACK"})
+    ax.set_title("Overall Sentiment Distribution", color="black")
+    return _png(fig)
+
+
+def _render_timeline_png(buckets: List[dict]) -> bytes:
+    fig = _new_figure()
+    fig.set_size_inches(10, 4)
+    ax = fig.add_subplot()
+    ax.set_facecolor(PLOT_BACKGROUND)
+    x = np.arange(len(buckets))
+    counts = np.array([b["count"] for b in buckets])
+    ax.bar(x, counts, color="#b8c7d3", label="Articles")
+    ax.set_ylabel("Articles per day", color="black")
+    ax.set_xticks(x, [b["day"][5:] for b in buckets], rotation=45, ha="right", fontsize=8)
+
+    # Mean polarity on a second axis; days without articles leave a gap.
+    pax = ax.twinx()
+    mean = np.array([np.nan if b["mean_polarity"] is None else b["mean_polarity"] for b in buckets])
+    pax.plot(x, mean, color="#333333", linewidth=1)
+    has = ~np.isnan(mean)
+    pax.scatter(x[has], mean[has], c=polarity_colors(mean[has]), zorder=3)
+    pax.axhline(0, color="#999999", linewidth=0.5)
+    pax.set_ylim(-1, 1)
+    pax.set_ylabel("Mean polarity (-1 to 1)", color="black")
+    ax.set_title("Sentiment Over Time", color="black")
+    return _png(fig)
+
+
+# --- VEGA-LITE ---
+
+def _polarity_spec(polarities: np.ndarray) -> dict:
+    return {
+        "title": "Sentiment Polarity",
+        "background": BACKGROUND,
+        "data": {"values": [{"index": i, "polarity": p} for i, p in enumerate(polarities.tolist())]},
+        "mark": "bar",
+        "encoding": {
+            "x": {"field": "index", "type": "ordinal", "title": "Article Index"},
+            "y": {"field": "polarity", "type": "quantitative", "title": "Polarity (-1 to 1)"},
+            "color": {
+                "field": "polarity",
+                "type": "quantitative",
+                "scale": {"scheme": "redyellowgreen", "domain": [-1, 1]},
+                "legend": None,
+            },
+        },
+    }
+
+
+def _distribution_spec(values: Sequence[int]) -> dict:
+    return {
+        "title": "Overall Sentiment Distribution",
+        "background": BACKGROUND,
+        "data": {"values": [{"label": label, "count": n} for label, n in zip(LABELS, values)]},
+        "mark": {"type": "arc", "tooltip": True},
+        "encoding": {
+            "theta": {"field": "count", "type": "quantitative", "stack": "normalize"},
+            "color": {
+                "field": "label",
+                "type": "nominal",
+                "sort": list(LABELS),
+                "scale": {"domain": list(LABELS), "range": list(LABEL_COLORS)},
+            },
+        },
+    }
+
+
+def _timeline_spec(buckets: List[dict]) -> dict:
+    x = {"field": "day", "type": "temporal", "title": None}
+    return {
+        "title": "Sentiment Over Time",
+        "background": BACKGROUND,
+        "data": {"values": buckets},
+        "layer": [
+            {
+                "mark": {"type": "bar", "color": "#b8c7d3", "tooltip": True},
+                "encoding": {"x": x, "y": {"field": "count", "type": "quantitative", "title": "Articles per day"}},
+            },
+            {
+                "mark": {"type": "line", "point": True, "color": "#333333", "tooltip": True},
+                "encoding": {
+                    "x": x,
+                    "y": {
+                        "field": "mean_polarity",
+                        "type": "quantitative",
+                        "title": "Mean polarity (-1 to 1)",
+                        "scale": {"domain": [-1, 1]},
+                    },
+                },
+            },
+        ],
+        "resolve": {"scale": {"y": "independent"}},
+    }
+
+
+# --- PUBLIC ---
+
+def polarity_chart(polarities: Sequence[float], backend: str = CHART_BACKEND) -> Chart:
+    """Bar chart of per-article polarity, colored red to green."""
+    values = np.asarray(polarities, dtype=np.float64)
+    key = chart_cache.make_key(backend, "polarity", values.tobytes())
+    chart = chart_cache.get(key)
+    if chart is None:
+        payload = _polarity_spec(values) if backend == "vega" else _render_polarity_png(values)
+        chart = Chart(backend, payload)
+        chart_cache.set(key, chart)
+    return chart
+
+
+def distribution_chart(counts: Dict[str, int], backend: str = CHART_BACKEND) -> Chart:
+    """Pie chart of Positive / Neutral / Negative label counts."""
+    values = [int(counts.get(label, 0)) for label in LABELS]
+    key = chart_cache.make_key(backend, "distribution", np.asarray(values, dtype=np.int64).tobytes())
+    chart = chart_cache.get(key)
+    if chart is None:
+        payload = _distribution_spec(values) if backend == "vega" else _render_distribution_png(values)
+        chart = Chart(backend, payload)
+        chart_cache.set(key, chart)
+    return chart
+
+
+def timeline_chart(buckets: List[dict], backend: str = CHART_BACKEND) -> Chart:
+    """Articles per day (bars) with mean polarity per day (line), from timeline buckets."""
+    key = chart_cache.make_key(backend, "timeline", json.dumps(buckets, sort_keys=True).encode("utf-8"))
+    chart = chart_cache.get(key)
+    if chart is None:
+        payload = _timeline_spec(buckets) if backend == "vega" else _render_timeline_png(buckets)
+        chart = Chart(backend, payload)
+        chart_cache.set(key, chart)
+    return chart
@@ -0,0 +1,99 @@
+# ai_news_verifier_app/cli.py
+"""Batch analysis without a browser.
+
+    python cli.py -f topics.txt --days 3 --workers 4 -o results.jsonl
+    printf 'AAPL\nclimate change\n' | python cli.py --no-summaries
+    python cli.py --search "rate cut" --limit 50
+
+Keywords are read one per line (blank lines and # comments skipped) from
+--file or stdin. Output is JSON lines: one {"type": "article", ...} record
+per article, then one {"type": "topic", ...} record per keyword. --search
+queries the local article store's full-text index instead, without
+fetching anything.
+"""
+import argparse
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import IO, Iterable, List
+
+from analysis import ARTICLES_PER_SOURCE, analyze_topic
+
+
+def read_keywords(lines: Iterable[str]) -> List[str]:
+    keywords = []
+    for line in lines:
+        line = line.strip()
+        if line and not line.startswith("#") and line not in keywords:
+            keywords.append(line)
+    return keywords
+
+
+def write_topic(result: dict, out: IO[str]) -> None:
+    for article in result["articles"]:
+        record = {"type": "article", "keyword": result["keyword"], **article.to_dict()}
+        out.write(json.dumps(record, ensure_ascii=False) + "\n")
+    topic = {"type": "topic", **{k: v for k, v in result.items() if k != "articles"}}
+    out.write(json.dumps(topic, ensure_ascii=False) + "\n")
+    out.flush()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Analyze news sentiment for many topics.")
+    parser.add_argument("-f", "--file", help="keywords file, one per line (default: stdin)")
+    parser.add_argument("-o", "--output", help="JSONL output file (default: stdout)")
+    parser.add_argument("--days", type=int, default=3, help="look-back window in days (default: 3)")
+    parser.add_argument("--per-source", type=int, default=ARTICLES_PER_SOURCE,
+                        help=f"articles kept per source (default: {ARTICLES_PER_SOURCE})")
+    parser.add_argument("--workers", type=int, default=4, help="topics processed at once (default: 4)")
+    parser.add_argument("--no-summaries", action="store_true", help="skip per-article Groq summaries")
+    parser.add_argument("--no-fake-check", action="store_true", help="skip the fake-news / wellness check")
+    parser.add_argument("--search", help="full-text search of already stored articles, then exit")
+    parser.add_argument("--limit", type=int, default=20, help="results for --search (default: 20)")
+    args = parser.parse_args(argv)
+
+    if args.search:
+        from store import article_store
+
+        for article in article_store.search(args.search, args.limit):
+            print(json.dumps({"type": "article", **article.to_dict()}, ensure_ascii=False))
+        return 0
+
+    if args.file:
+        with open(args.file, encoding="utf-8") as f:
+            keywords = read_keywords(f)
+    else:
+        keywords = read_keywords(sys.stdin)
+    if not keywords:
+        parser.error("no keywords given")
+
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    failed = 0
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, args.workers)) as pool:
+            futures = {
+                pool.submit(
+                    analyze_topic,
+                    keyword,
+                    args.days,
+                    args.per_source,
+                    not args.no_summaries,
+                    not args.no_fake_check,
+                ): keyword
+                for keyword in keywords
+            }
+            # Written from this thread only, as each topic finishes.
+            for future in as_completed(futures):
+                try:
+                    write_topic(future.result(), out)
+                except Exception as e:
+                    failed += 1
+                    print(f"{futures[future]}: {e}", file=sys.stderr)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
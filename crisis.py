@@ -0,0 +1,183 @@
+# ai_news_verifier_app/crisis.py
+import re
+from typing import Dict, List
+
+# --- CRISIS KEYWORDS ---
+
+CRISIS_KEYWORDS = [
+    # Death / Injury / Disaster
+    "kill", "killed", "kills", "dead", "death", "deaths", "injured", "injury",
+    "hospitalized", "critical", "fatal", "fatalities", "casualties", "massacre",
+    "tragedy", "catastrophe", "horror", "collapse", "died",
+
+    # Violence / Crime / Abuse
+    "attack", "attacked", "shot", "shooting", "gunfire", "gunman", "murder",
+    "murdered", "assault", "rape", "raped", "molested", "harassment",
+    "abuse", "abused", "abducted", "kidnap", "kidnapped", "trafficking", "crime",
+    "violent", "violence", "stabbed", "acid attack", "victim",
+
+    # War / Terrorism
+    "terror", "terrorist", "bomb", "bombing", "explosion", "missile",
+    "airstrike", "war", "warfare", "conflict", "invasion", "clash", "hostage",
+    "militia", "genocide", "extremist",
+
+    # Natural Disaster
+    "earthquake", "tsunami", "volcano", "eruption", "flood", "floods",
+    "landslide", "landslides", "cyclone", "hurricane", "tornado",
+    "storm", "wildfire", "fire", "burned", "scorching", "heatwave",
+
+    # Public Health / Disease
+    "outbreak", "infection", "disease", "epidemic", "pandemic",
+    "virus", "covid", "ebola", "cholera", "outbreaks", "poisoned",
+
+    # Economic / Social Crisis
+    "bankruptcy", "inflation", "recession", "unemployment",
+    "poverty", "homeless", "famine", "shortage", "crisis",
+
+    # Safety Threats / Accidents
+    "accident", "crash", "collision", "derailed", "plane crash",
+    "train crash", "bus crash", "injuries",
+
+    # Hate / Discrimination
+    "racism", "hate crime", "lynching", "discrimination",
+    "religious violence", "honor killing", "hate speech",
+]
+
+
+# Real inflected forms of the keywords above. Listed by hand rather than
+# generated: suffix rules also produce words that mean something else
+# ("wares", a CEO "fires") or no word at all ("warism").
+INFLECTED_FORMS = {
+    "kill": ["kills", "killing", "killings", "killer", "killers"],
+    "fatal": ["fatality"],
+    "massacre": ["massacres", "massacred"],
+    "tragedy": ["tragedies"],
+    "catastrophe": ["catastrophes", "catastrophic"],
+    "horror": ["horrors"],
+    "collapse": ["collapses", "collapsed", "collapsing"],
+    "attack": ["attacks", "attacking", "attacker", "attackers"],
+    "shooting": ["shootings"],
+    "gunman": ["gunmen"],
+    "murder": ["murders", "murdering", "murderer", "murderers"],
+    "assault": ["assaults", "assaulted"],
+    "rape": ["rapes", "rapist", "rapists"],
+    "abuse": ["abuses", "abusing", "abuser", "abusers"],
+    "kidnap": ["kidnaps", "kidnapping", "kidnappings", "kidnapper", "kidnappers"],
+    "crime": ["crimes"],
+    "acid attack": ["acid attacks"],
+    "victim": ["victims"],
+    "terror": ["terrorism"],
+    "terrorist": ["terrorists"],
+    "bomb": ["bombs", "bombed"],
+    "bombing": ["bombings"],
+    "explosion": ["explosions"],
+    "missile": ["missiles"],
+    "airstrike": ["airstrikes"],
+    "war": ["wars", "warring"],
+    "conflict": ["conflicts"],
+    "invasion": ["invasions"],
+    "clash": ["clashes", "clashed"],
+    "hostage": ["hostages"],
+    "militia": ["militias"],
+    "extremist": ["extremists", "extremism"],
+    "earthquake": ["earthquakes"],
+    "tsunami": ["tsunamis"],
+    "volcano": ["volcanoes"],
+    "eruption": ["eruptions"],
+    "flood": ["flooded", "flooding"],
+    "cyclone": ["cyclones"],
+    "hurricane": ["hurricanes"],
+    "tornado": ["tornadoes"],
+    "storm": ["storms"],
+    "wildfire": ["wildfires"],
+    "heatwave": ["heatwaves"],
+    "infection": ["infections"],
+    "disease": ["diseases"],
+    "epidemic": ["epidemics"],
+    "virus": ["viruses"],
+    "shortage": ["shortages"],
+    "crisis": ["crises"],
+    "accident": ["accidents"],
+    "crash": ["crashes", "crashed", "crashing"],
+    "collision": ["collisions"],
+    "plane crash": ["plane crashes"],
+    "train crash": ["train crashes"],
+    "bus crash": ["bus crashes"],
+    "hate crime": ["hate crimes"],
+    "lynching": ["lynchings"],
+    "honor killing": ["honor killings"],
+}
+
+# Keywords and their forms match as whole words, so "war" no longer fires on
+# "software" and "fire" not on "firefox". Multi-word phrases tolerate any run
+# of whitespace.
+_UNIQUE_KEYWORDS = sorted(set(kw.lower() for kw in CRISIS_KEYWORDS))
+
+
+def _keyword_forms() -> Dict[str, str]:
+    """Every accepted form (lowercase, single-spaced) -> the keyword it inflects."""
+    forms = {kw: kw for kw in _UNIQUE_KEYWORDS}  # "killed" stays "killed", not "kill"
+    for kw, inflected in INFLECTED_FORMS.items():
+        for form in inflected:
+            forms.setdefault(form, kw)
+    return forms
+
+
+_FORM_KEYWORD = _keyword_forms()
+
+
+def _trie_pattern(words: List[str]) -> str:
+    """One regex alternation with shared prefixes factored out ("kill(?:ed|s)?").
+
+    Python's re engine does not optimize plain alternations, so a flat
+    "kill|killed|kills|..." retries every branch at every position; the trie
+    form only follows branches whose prefix already matched.
+    """
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node: dict) -> str:
+        branches = [
+            (r"\s+" if ch == " " else re.escape(ch)) + build(child)
+            for ch, child in sorted(node.items())
+            if ch
+        ]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+CRISIS_PATTERN = re.compile(r"\b(" + _trie_pattern(sorted(_FORM_KEYWORD)) + r")\b", re.IGNORECASE)
+
+# Fast path for the yes/no question: split into words once and intersect with
+# every accepted single-word form. Only texts containing the first word of a
+# phrase ("plane", "hate", ...) fall through to the regex.
+_WORD_RE = re.compile(r"\w+")
+_SINGLE_FORMS = frozenset(form for form in _FORM_KEYWORD if " " not in form)
+_PHRASE_HEADS = frozenset(kw.split()[0] for kw in _UNIQUE_KEYWORDS if " " in kw)
+
+
+def has_crisis_keyword(text: str) -> bool:
+    words = _WORD_RE.findall(text.lower())
+    if not _SINGLE_FORMS.isdisjoint(words):
+        return True
+    if _PHRASE_HEADS.isdisjoint(words):
+        return False
+    return CRISIS_PATTERN.search(text) is not None
+
+
+def find_crisis_keywords(text: str) -> List[str]:
+    """Return the distinct crisis keywords found in `text`, in order of appearance."""
+    found = []
+    for match in CRISIS_PATTERN.finditer(text):
+        keyword = _FORM_KEYWORD[" ".join(match.group(1).lower().split())]
+        if keyword not in found:
+            found.append(keyword)
+    return found
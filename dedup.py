@@ -0,0 +1,168 @@
+# ai_news_verifier_app/dedup.py
+"""Collapse near-duplicate articles (syndicated / reposted stories) into clusters."""
+import hashlib
+import os
+import re
+from typing import Dict, List
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import numpy as np
+
+from pipeline import Article
+
+# Two headlines are the same story when their word sets overlap at least this
+# much (Jaccard: shared words / all words) and no word found in only one of
+# them names something (see Fingerprint.entities). With headline-length word
+# sets, 0.8 lets one word be added or dropped but not swapped for another.
+DEDUP_MIN_SIMILARITY = float(os.getenv("DEDUP_MIN_SIMILARITY", "0.8"))
+# Headlines with fewer distinct content words only ever merge on URL.
+DEDUP_MIN_WORDS = int(os.getenv("DEDUP_MIN_WORDS", "4"))
+
+# 10 bands of 3 rows: pairs at 0.8 similarity share a band 99.9% of the time,
+# unrelated pairs (< 0.3) under a quarter of the time.
+MINHASH_PERMUTATIONS = 30
+MINHASH_BANDS = 10
+
+# Query parameters that only track the click, not the content.
+TRACKING_PARAMS = re.compile(r"^(utm_\w+|fbclid|gclid|mc_cid|mc_eid|ref|cmpid|ocid|taid)$", re.IGNORECASE)
+
+# Filler words and wire bylines that say nothing about which story it is.
+STOP_WORDS = frozenset(
+    "a an the of to in on at for and or its it is are was were with by from as "
+    "that this be has have had will after over says said reuters ap afp percent pct".split()
+)
+# Wire services word the same story differently; fold the common variants.
+SYNONYMS = {"share": "stock", "shares": "stock", "stocks": "stock"}
+
+_WORD_RE = re.compile(r"\w+")
+_SEEDS = np.random.default_rng(12).integers(0, 2**63, MINHASH_PERMUTATIONS, dtype=np.uint64)
+_MIX = np.uint64(0x9E3779B97F4A7C15)
+
+
+def canonical_url(url: str) -> str:
+    """Scheme-less, lowercase host without www., no fragment, tracking params or trailing slash."""
+    if not url:
+        return ""
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    query = urlencode(sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not TRACKING_PARAMS.match(k)
+    ))
+    path = parts.path.rstrip("/")
+    # amp pages are the same story
+    if path.endswith("/amp"):
+        path = path[:-4]
+    return urlunsplit(("", host, path, query, ""))
+
+
+def _feature_hash(feature: str) -> int:
+    return int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def _normalize(word: str) -> str:
+    word = SYNONYMS.get(word, word)
+    # Crude plural / third-person "s" so "rises" and "rise" agree.
+    if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+        word = word[:-1]
+    return SYNONYMS.get(word, word)
+
+
+class Fingerprint:
+    """Content words of a headline, which of them name something, and their MinHash."""
+
+    __slots__ = ("words", "entities", "signature")
+
+    def __init__(self, article: Article):
+        words, capitalized = set(), set()
+        for raw in _WORD_RE.findall(article.title):
+            word = raw.lower()
+            if word in STOP_WORDS:
+                continue
+            word = _normalize(word)
+            words.add(word)
+            if raw[0].isupper() or any(ch.isdigit() for ch in raw):
+                capitalized.add(word)
+        # A capitalized word is a name unless the article also uses it in
+        # lowercase (title-case headlines capitalize everything). Numbers
+        # always count: "rises 3%" and "rises 5%" are different stories.
+        lowercase = {_normalize(w) for w in _WORD_RE.findall(article.text) if w.islower()}
+        self.words = frozenset(words)
+        self.entities = frozenset(w for w in capitalized if w not in lowercase)
+        self.signature = _minhash(self.words) if len(self.words) >= DEDUP_MIN_WORDS else None
+
+
+def _minhash(words) -> np.ndarray:
+    hashes = np.array([_feature_hash(word) for word in words], dtype=np.uint64)
+    mixed = (hashes[:, None] ^ _SEEDS) * _MIX  # wraps mod 2**64
+    return (mixed ^ (mixed >> np.uint64(29))).min(axis=0)
+
+
+def same_story(a: Fingerprint, b: Fingerprint, min_similarity: float = DEDUP_MIN_SIMILARITY) -> bool:
+    """Exact check behind the MinHash candidates: enough overlap, and no entity on only one side."""
+    if a.signature is None or b.signature is None:
+        return False
+    shared = a.words & b.words
+    if len(shared) < min_similarity * len(a.words | b.words):
+        return False
+    return not ((a.words - shared) & a.entities or (b.words - shared) & b.entities)
+
+
+def cluster(articles: List[Article], min_similarity: float = DEDUP_MIN_SIMILARITY) -> List[List[int]]:
+    """Group article indices into near-duplicate clusters, in first-seen order.
+
+    Two articles join when their canonical URLs are equal or their headlines
+    pass `same_story`. Candidates come from MinHash banding: headlines whose
+    signatures agree on any band are compared exactly.
+    """
+    parent = list(range(len(articles)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(i: int, j: int) -> None:
+        ri, rj = find(i), find(j)
+        if ri != rj:
+            parent[max(ri, rj)] = min(ri, rj)
+
+    by_url: Dict[str, int] = {}
+    for i, article in enumerate(articles):
+        url = canonical_url(article.url)
+        if url:
+            if url in by_url:
+                union(by_url[url], i)
+            else:
+                by_url[url] = i
+
+    rows = MINHASH_PERMUTATIONS // MINHASH_BANDS
+    buckets: Dict[tuple, List[int]] = {}
+    prints = [Fingerprint(article) for article in articles]
+    for i, fp in enumerate(prints):
+        if fp.signature is None:
+            continue
+        for band in range(MINHASH_BANDS):
+            key = (band, fp.signature[band * rows:(band + 1) * rows].tobytes())
+            for j in buckets.get(key, ()):
+                if find(i) != find(j) and same_story(fp, prints[j], min_similarity):
+                    union(i, j)
+            buckets.setdefault(key, []).append(i)
+
+    clusters: Dict[int, List[int]] = {}
+    for i in range(len(articles)):
+        clusters.setdefault(find(i), []).append(i)
+    return list(clusters.values())
+
+
+def collapse(articles: List[Article], min_similarity: float = DEDUP_MIN_SIMILARITY) -> List[Article]:
+    """Keep the first article of each cluster, recording every member's source on it."""
+    kept = []
+    for members in cluster(articles, min_similarity):
+        head = articles[members[0]]
+        head.sources = [articles[i].source for i in members]
+        kept.append(head)
+    return kept
@@ -0,0 +1,245 @@
+# ai_news_verifier_app/fetchers.py
+import os
+import random
+import time
+from datetime import datetime, timedelta
+from email.utils import parsedate_to_datetime
+from typing import Iterator, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+import metrics
+from cache import CachedResponse, HTTP_CACHE_TTL, http_cache
+
+# --- API KEYS ---
+NEWS_API_KEY = os.getenv("NEWS_API_KEY")
+POLYGON_API_KEY = os.getenv("POLYGON_API_KEY")
+
+# Overridable so benchmarks can point at local stand-ins.
+NEWSAPI_URL = os.getenv("NEWSAPI_URL", "https://newsapi.org/v2/everything")
+POLYGON_URL = os.getenv("POLYGON_URL", "https://api.polygon.io/v2/reference/news")
+
+# --- TIMEOUTS & RETRIES ---
+# (connect, read) seconds per source, e.g. NEWSAPI_READ_TIMEOUT=15.
+SOURCE_TIMEOUTS = {
+    "newsapi": (
+        float(os.getenv("NEWSAPI_CONNECT_TIMEOUT", "3.05")),
+        float(os.getenv("NEWSAPI_READ_TIMEOUT", "10")),
+    ),
+    "polygon": (
+        float(os.getenv("POLYGON_CONNECT_TIMEOUT", "3.05")),
+        float(os.getenv("POLYGON_READ_TIMEOUT", "10")),
+    ),
+}
+
+FETCH_MAX_RETRIES = int(os.getenv("FETCH_MAX_RETRIES", "3"))
+# Most articles the paginated fetchers pull per source for one query.
+FETCH_ARTICLE_BUDGET = int(os.getenv("FETCH_ARTICLE_BUDGET", "2000"))
+FETCH_BACKOFF_BASE = 0.5  # seconds, doubled on every retry
+FETCH_BACKOFF_MAX = 8.0   # also caps how long we honor Retry-After
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class FetchError(Exception):
+    """A source could not be fetched after all retries."""
+
+
+def _make_session() -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# One pooled session for every source, so repeat queries reuse keep-alive connections.
+session = _make_session()
+
+
+def _retry_after(res: Optional[requests.Response]) -> Optional[float]:
+    """Seconds requested by a Retry-After header (delta or HTTP date), if any."""
+    if res is None:
+        return None
+    value = res.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _backoff(attempt: int, res: Optional[requests.Response] = None) -> float:
+    delay = _retry_after(res)
+    if delay is None:
+        # Full jitter around an exponential step keeps parallel clients from syncing up.
+        delay = FETCH_BACKOFF_BASE * (2 ** attempt) * random.uniform(0.5, 1.5)
+    return min(delay, FETCH_BACKOFF_MAX)
+
+
+def _get_json_uncached(
+    url: str, params: dict, timeout: Tuple[float, float], headers: dict, source: str = ""
+) -> requests.Response:
+    """GET `url` over the pooled session, retrying 429/5xx and network errors.
+
+    Returns the final 200 or 304 response; anything else raises FetchError.
+    """
+    for attempt in range(FETCH_MAX_RETRIES + 1):
+        last_try = attempt == FETCH_MAX_RETRIES
+        try:
+            res = session.get(url, params=params, timeout=timeout, headers=headers)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            if last_try:
+                raise FetchError(f"{type(e).__name__}: {e}") from e
+            metrics.inc("fetch_retries_total", source=source)
+            time.sleep(_backoff(attempt))
+            continue
+        if res.status_code in (200, 304):
+            return res
+        if res.status_code in RETRY_STATUSES and not last_try:
+            metrics.inc("fetch_retries_total", source=source)
+            time.sleep(_backoff(attempt, res))
+            continue
+        raise FetchError(f"HTTP {res.status_code}")
+    raise FetchError("retries exhausted")
+
+
+def get_json(
+    url: str, params: dict, timeout: Tuple[float, float], source: str = "", in_memory: bool = True
+) -> dict:
+    """GET a JSON document, served from the response cache while it is fresh.
+
+    A stale entry is revalidated with its ETag / Last-Modified; if upstream
+    fails outright, the stale copy is returned rather than nothing.
+    in_memory=False keeps the document out of the in-process cache tier.
+    """
+    key = http_cache.make_key(url, params)
+    entry = http_cache.get(key, in_memory)
+    if entry is not None and entry.is_fresh(HTTP_CACHE_TTL):
+        return entry.body
+
+    headers = {}
+    if entry is not None:
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+
+    try:
+        res = _get_json_uncached(url, params, timeout, headers, source)
+    except FetchError:
+        metrics.inc("fetch_errors_total", source=source)
+        if entry is not None:
+            return entry.body
+        raise
+
+    if res.status_code == 304 and entry is not None:
+        return http_cache.touch(key, entry, in_memory).body
+    body = res.json()
+    http_cache.set(key, CachedResponse(
+        body, res.headers.get("ETag"), res.headers.get("Last-Modified"), time.time()
+    ), in_memory)
+    return body
+
+
+# --- FETCH NEWSAPI.ORG ---
+def fetch_newsapi_news(
+    keyword: str, days: int, since: Optional[str] = None, until: Optional[str] = None
+) -> List[dict]:
+    from_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
+    params = {
+        "q": keyword,
+        "from": since or from_date,
+        "to": until,
+        "language": "en",
+        "sortBy": "publishedAt",
+        "pageSize": 30,
+        "apiKey": NEWS_API_KEY,
+    }
+    return get_json(NEWSAPI_URL, params, SOURCE_TIMEOUTS["newsapi"], "newsapi").get("articles", [])
+
+
+# --- FETCH POLYGON ---
+def fetch_polygon_news(
+    keyword: str, days: int, since: Optional[str] = None, until: Optional[str] = None
+) -> List[dict]:
+    start_date = datetime.now() - timedelta(days=days)
+    params = {
+        "ticker": keyword.upper(),
+        "published_utc.gte": since or start_date.strftime('%Y-%m-%d'),
+        "published_utc.lt": until,
+        "sort": "published_utc",
+        "order": "desc",
+        "limit": 50,
+        "apiKey": POLYGON_API_KEY,
+    }
+    return get_json(POLYGON_URL, params, SOURCE_TIMEOUTS["polygon"], "polygon").get("results", [])
+
+
+# --- PAGINATED FETCH ---
+# Generators yield one page of raw items at a time, so a caller can score and
+# drop each page before the next is requested. Both stop at `budget` items,
+# and take the same optional `since` / `until` bounds as the fetch functions.
+# Pages still land in the SQLite response cache, but not in its memory tier.
+NEWSAPI_PAGE_SIZE = 100   # NewsAPI's maximum pageSize
+POLYGON_PAGE_SIZE = 1000  # Polygon's maximum limit
+
+
+def iter_newsapi_pages(
+    keyword: str, days: int, budget: int = FETCH_ARTICLE_BUDGET,
+    since: Optional[str] = None, until: Optional[str] = None,
+) -> Iterator[List[dict]]:
+    from_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
+    page_size = max(1, min(NEWSAPI_PAGE_SIZE, budget))
+    params = {
+        "q": keyword,
+        "from": since or from_date,
+        "to": until,
+        "language": "en",
+        "sortBy": "publishedAt",
+        "pageSize": page_size,
+        "page": 1,
+        "apiKey": NEWS_API_KEY,
+    }
+    seen = 0
+    while seen < budget:
+        body = get_json(NEWSAPI_URL, params, SOURCE_TIMEOUTS["newsapi"], "newsapi", in_memory=False)
+        items = body.get("articles", [])
+        if items[:budget - seen]:
+            yield items[:budget - seen]
+        seen += len(items)
+        if len(items) < page_size or seen >= (body.get("totalResults") or 0):
+            return
+        params = {**params, "page": params["page"] + 1}
+
+
+def iter_polygon_pages(
+    keyword: str, days: int, budget: int = FETCH_ARTICLE_BUDGET,
+    since: Optional[str] = None, until: Optional[str] = None,
+) -> Iterator[List[dict]]:
+    start_date = datetime.now() - timedelta(days=days)
+    url = POLYGON_URL
+    params = {
+        "ticker": keyword.upper(),
+        "published_utc.gte": since or start_date.strftime('%Y-%m-%d'),
+        "published_utc.lt": until,
+        "sort": "published_utc",
+        "order": "desc",
+        "limit": max(1, min(POLYGON_PAGE_SIZE, budget)),
+        "apiKey": POLYGON_API_KEY,
+    }
+    seen = 0
+    while url and seen < budget:
+        body = get_json(url, params, SOURCE_TIMEOUTS["polygon"], "polygon", in_memory=False)
+        items = body.get("results", [])
+        if items[:budget - seen]:
+            yield items[:budget - seen]
+        seen += len(items)
+        # next_url already carries the query and the cursor; only the key is added back.
+        url = body.get("next_url")
+        params = {"apiKey": POLYGON_API_KEY}
@@ -0,0 +1,549 @@
+# ai_news_verifier_app/llm.py
+import contextvars
+import json
+import os
+import random
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import metrics
+from cache import llm_cache
+from singleflight import SingleFlight
+
+# --- GROQ CLIENT ---
+GROQ_API_KEY = os.getenv("GROQ_API_KEY")
+
+GROQ_MODEL = "llama-3.1-8b-instant"  # single source of truth for model
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client():
+    """The process-wide Groq client, built on first use.
+
+    Importing groq (and httpx under it) is a good share of cold start, and
+    cached runs never need it.
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                from groq import Groq
+
+                # Retries happen in chat()/chat_stream(), where they are counted.
+                _client = Groq(api_key=GROQ_API_KEY, max_retries=0)
+    return _client
+
+# --- RATE LIMITS ---
+# Defaults match the Groq free tier for llama-3.1-8b-instant; override per deployment.
+GROQ_REQUESTS_PER_MINUTE = float(os.getenv("GROQ_REQUESTS_PER_MINUTE", "30"))
+GROQ_TOKENS_PER_MINUTE = float(os.getenv("GROQ_TOKENS_PER_MINUTE", "6000"))
+GROQ_MAX_WORKERS = int(os.getenv("GROQ_MAX_WORKERS", "8"))
+
+# --- RETRIES ---
+# 408/409/429/5xx and connection errors are retried, like the SDK would by default.
+GROQ_MAX_RETRIES = int(os.getenv("GROQ_MAX_RETRIES", "2"))
+GROQ_BACKOFF_BASE = 0.5  # seconds, doubled on every retry
+GROQ_BACKOFF_MAX = 8.0   # also caps how long we honor Retry-After
+
+# Articles packed into one summarization call; 1 disables batching.
+SUMMARY_BATCH_SIZE = int(os.getenv("GROQ_SUMMARY_BATCH_SIZE", "10"))
+
+# Rough allowance for the completion side of a summary when budgeting tokens.
+SUMMARY_COMPLETION_TOKENS = 150
+
+# Headlines per fake-check prompt are capped at about this many tokens; larger
+# sets are analyzed in chunks (map) and the chunk notes merged (reduce).
+FAKE_CHECK_CHUNK_TOKENS = int(os.getenv("GROQ_FAKE_CHECK_CHUNK_TOKENS", "2000"))
+FAKE_CHECK_COMPLETION_TOKENS = 600
+FAKE_CHECK_NOTES_TOKENS = 300  # cap on each chunk's notes, so the map step stays quick
+
+SUMMARY_FALLBACK = "(Summary not available due to rate limit or API error.)"
+FAKE_CHECK_FALLBACK = "(Unable to generate summary due to rate limit or API error.)"
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate (~4 characters per token), good enough for budgeting."""
+    return max(1, len(text) // 4)
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled continuously at `per_minute` units per minute."""
+
+    def __init__(self, per_minute: float, capacity: Optional[float] = None):
+        self.rate = per_minute / 60.0
+        self.capacity = capacity if capacity is not None else per_minute
+        self.available = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.available = min(self.capacity, self.available + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self, amount: float = 1.0) -> None:
+        """Block until `amount` units are available, then take them."""
+        # A single request larger than the whole bucket would never fit; cap it.
+        amount = min(amount, self.capacity)
+        while True:
+            with self.lock:
+                self._refill()
+                if self.available >= amount:
+                    self.available -= amount
+                    return
+                wait = (amount - self.available) / self.rate
+            time.sleep(wait)
+
+
+class RateLimiter:
+    """Requests-per-minute and tokens-per-minute limits applied together."""
+
+    def __init__(self, requests_per_minute: float, tokens_per_minute: float):
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+
+    def acquire(self, tokens: int) -> None:
+        start = time.perf_counter()
+        self.requests.acquire(1)
+        self.tokens.acquire(tokens)
+        metrics.inc("groq_rate_limit_wait_seconds_total", time.perf_counter() - start)
+
+
+# Shared by every Groq call in the process so parallel callers respect one budget.
+rate_limiter = RateLimiter(GROQ_REQUESTS_PER_MINUTE, GROQ_TOKENS_PER_MINUTE)
+
+# Identical prompts sent at the same time (e.g. several sessions opening the
+# same trending topic) share one Groq request. Keyed by (model, prompt).
+groq_flights = SingleFlight("groq")
+
+
+def _retryable(error: Exception) -> bool:
+    import groq
+
+    if isinstance(error, groq.APIConnectionError):  # timeouts included
+        return True
+    if isinstance(error, groq.APIStatusError):
+        return error.status_code in (408, 409, 429) or error.status_code >= 500
+    return False
+
+
+def _retry_delay(attempt: int, error: Exception) -> float:
+    response = getattr(error, "response", None)
+    try:
+        delay = float(response.headers.get("retry-after"))
+    except (AttributeError, TypeError, ValueError):
+        # Full jitter around an exponential step keeps parallel workers from syncing up.
+        delay = GROQ_BACKOFF_BASE * (2 ** attempt) * random.uniform(0.5, 1.5)
+    return min(max(0.0, delay), GROQ_BACKOFF_MAX)
+
+
+def chat(kind: str, prompt: str, tokens: int, **kwargs):
+    """One Groq chat completion, timed and counted under `kind`.
+
+    `tokens` (prompt plus expected completion) is taken from the rate
+    limiter before every attempt. Transient failures are retried up to
+    GROQ_MAX_RETRIES times; every attempt counts as a request, every retry
+    under groq_retries_total.
+    """
+    for attempt in range(GROQ_MAX_RETRIES + 1):
+        rate_limiter.acquire(tokens)
+        metrics.inc("groq_requests_total", kind=kind)
+        try:
+            with metrics.span(f"groq_{kind}"):
+                response = get_client().chat.completions.create(
+                    model=GROQ_MODEL,
+                    messages=[{"role": "user", "content": prompt}],
+                    **kwargs,
+                )
+            break
+        except Exception as e:
+            if attempt < GROQ_MAX_RETRIES and _retryable(e):
+                metrics.inc("groq_retries_total", kind=kind)
+                time.sleep(_retry_delay(attempt, e))
+                continue
+            metrics.inc("groq_errors_total", kind=kind)
+            raise
+    usage = getattr(response, "usage", None)
+    if usage is not None:
+        metrics.inc("groq_prompt_tokens_total", usage.prompt_tokens or 0)
+        metrics.inc("groq_completion_tokens_total", usage.completion_tokens or 0)
+    return response
+
+
+def chat_stream(kind: str, prompt: str, tokens: int, **kwargs) -> Iterator[str]:
+    """Stream one Groq chat completion, yielding content deltas as they arrive.
+
+    Rate limited, counted and retried like `chat`, but only until the first
+    delta: text already handed to the caller can't be taken back. Time to
+    the first delta, retries included, is recorded as its own span.
+    """
+    start = time.perf_counter()
+    first = True
+    usage = None
+    for attempt in range(GROQ_MAX_RETRIES + 1):
+        rate_limiter.acquire(tokens)
+        metrics.inc("groq_requests_total", kind=kind)
+        try:
+            with metrics.span(f"groq_{kind}"):
+                stream = get_client().chat.completions.create(
+                    model=GROQ_MODEL,
+                    messages=[{"role": "user", "content": prompt}],
+                    stream=True,
+                    **kwargs,
+                )
+                for chunk in stream:
+                    # Groq reports usage on the last chunk under x_groq; OpenAI-style servers on the chunk.
+                    x_groq = getattr(chunk, "x_groq", None)
+                    usage = getattr(x_groq, "usage", None) or getattr(chunk, "usage", None) or usage
+                    delta = chunk.choices[0].delta.content if chunk.choices else None
+                    if delta:
+                        if first:
+                            first = False
+                            metrics.observe(f"groq_{kind}_first_token", time.perf_counter() - start)
+                        yield delta
+            break
+        except Exception as e:
+            if first and attempt < GROQ_MAX_RETRIES and _retryable(e):
+                metrics.inc("groq_retries_total", kind=kind)
+                time.sleep(_retry_delay(attempt, e))
+                continue
+            metrics.inc("groq_errors_total", kind=kind)
+            raise
+    if usage is not None:
+        metrics.inc("groq_prompt_tokens_total", usage.prompt_tokens or 0)
+        metrics.inc("groq_completion_tokens_total", usage.completion_tokens or 0)
+
+
+def summary_prompt(full_text: str) -> str:
+    return f"Summarize this news in one short paragraph: {full_text}"
+
+
+def _request_summary(full_text: str) -> str:
+    """Call Groq for one article and cache the result (failures are not cached)."""
+    prompt = summary_prompt(full_text)
+    return groq_flights.do((GROQ_MODEL, prompt), _call_summary, prompt)
+
+
+def _call_summary(prompt: str) -> str:
+    try:
+        response = chat("summary", prompt, estimate_tokens(prompt) + SUMMARY_COMPLETION_TOKENS)
+        summary = response.choices[0].message.content.strip()
+    except Exception as e:
+        # You can inspect e if you want, but keep it user-friendly in UI
+        return SUMMARY_FALLBACK
+    llm_cache.set(GROQ_MODEL, prompt, summary)
+    return summary
+
+
+def summarize_with_groq(full_text: str) -> str:
+    """Summarize one article with Groq, with simple error handling."""
+    cached = llm_cache.get(GROQ_MODEL, summary_prompt(full_text))
+    if cached is not None:
+        return cached
+    return _request_summary(full_text)
+
+
+def batch_summary_prompt(texts: List[str]) -> str:
+    numbered = "\n".join(f"[{i}] {text}" for i, text in enumerate(texts, start=1))
+    return (
+        "Summarize each of the following news articles in one short paragraph.\n"
+        "Respond with only a JSON object that maps each article number (as a string) "
+        'to its summary, for example {"1": "...", "2": "..."}.\n\n'
+        f"Articles:\n{numbered}"
+    )
+
+
+def parse_batch_summaries(content: str, count: int) -> Dict[int, str]:
+    """Pull per-article summaries out of a batch reply, keyed by 0-based index.
+
+    Anything that is missing, empty or not parseable is simply left out, so the
+    caller can retry just those articles.
+    """
+    # Models sometimes wrap JSON in prose or ``` fences; keep the outermost object.
+    match = re.search(r"\{.*\}", content, re.DOTALL)
+    if not match:
+        return {}
+    try:
+        data = json.loads(match.group(0))
+    except ValueError:
+        return {}
+    if not isinstance(data, dict):
+        return {}
+
+    summaries = {}
+    for key, value in data.items():
+        try:
+            index = int(str(key).strip().strip("[]")) - 1
+        except ValueError:
+            continue
+        if 0 <= index < count and isinstance(value, str) and value.strip():
+            summaries[index] = value.strip()
+    return summaries
+
+
+def summarize_batch(texts: List[str]) -> List[str]:
+    """Summarize several (uncached) articles with a single Groq call.
+
+    Articles the model skipped (or a failed call altogether) fall back to
+    one single-article call each.
+    """
+    if len(texts) == 1:
+        return [_request_summary(texts[0])]
+
+    prompt = batch_summary_prompt(texts)
+    parsed = groq_flights.do((GROQ_MODEL, prompt), _call_summary_batch, prompt, texts)
+    missing = len(texts) - len(parsed)
+    if missing:
+        metrics.inc("groq_fallback_requests_total", missing)
+    return [
+        parsed[i] if i in parsed else _request_summary(text)
+        for i, text in enumerate(texts)
+    ]
+
+
+def _call_summary_batch(prompt: str, texts: List[str]) -> Dict[int, str]:
+    parsed: Dict[int, str] = {}
+    try:
+        tokens = estimate_tokens(prompt) + SUMMARY_COMPLETION_TOKENS * len(texts)
+        response = chat("summary_batch", prompt, tokens, response_format={"type": "json_object"})
+        parsed = parse_batch_summaries(response.choices[0].message.content or "", len(texts))
+    except Exception:
+        parsed = {}
+
+    # Cache per article under its single-article prompt, so a story is a hit
+    # next time no matter which batch it lands in.
+    for i, summary in parsed.items():
+        llm_cache.set(GROQ_MODEL, summary_prompt(texts[i]), summary)
+    return parsed
+
+
+def iter_summaries(
+    texts: List[str],
+    max_workers: Optional[int] = None,
+    batch_size: Optional[int] = None,
+) -> Iterator[Tuple[int, str]]:
+    """Yield (index, summary) pairs for `texts` as soon as each is ready.
+
+    Cached summaries come first, then each batch as its Groq call finishes.
+    Articles are packed `batch_size` at a time into one call each (see
+    `summarize_batch`) and batches run in parallel behind the shared rate
+    limiter. Consume this from the caller's thread, e.g. to update UI.
+    """
+    pending = []
+    for i, text in enumerate(texts):
+        cached = llm_cache.get(GROQ_MODEL, summary_prompt(text))
+        if cached is None:
+            pending.append(i)
+        else:
+            yield i, cached
+    if not pending:
+        return
+
+    size = max(1, batch_size or SUMMARY_BATCH_SIZE)
+    batches = [pending[i:i + size] for i in range(0, len(pending), size)]
+    workers = min(max_workers or GROQ_MAX_WORKERS, len(batches))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        # Each worker runs in a copy of our context so its spans land in the caller's trace.
+        futures = {
+            pool.submit(contextvars.copy_context().run, summarize_batch, [texts[i] for i in batch]): batch
+            for batch in batches
+        }
+        for future in as_completed(futures):
+            for i, summary in zip(futures[future], future.result()):
+                yield i, summary
+
+
+def summarize_many(
+    texts: List[str],
+    max_workers: Optional[int] = None,
+    batch_size: Optional[int] = None,
+) -> List[str]:
+    """Summarize articles in parallel; results come back in the order of `texts`."""
+    summaries: List[Optional[str]] = [None] * len(texts)
+    for i, summary in iter_summaries(texts, max_workers, batch_size):
+        summaries[i] = summary
+    return summaries
+
+
+# --- FAKE NEWS & WELLNESS CHECK ---
+
+def fake_check_prompt(news_list: str) -> str:
+    return f"""
+You are an AI truth checker and wellness advisor. Analyze the following news headlines.
+- Detect any that seem fake or manipulative.
+- Summarize the overall trend.
+- Provide mental wellness tips if sentiment is negative.
+
+News:
+{news_list}
+"""
+
+
+def fake_check_map_prompt(headlines: List[str]) -> str:
+    news = "\n".join(headlines)
+    return f"""
+You are an AI truth checker. These headlines are one part of a larger set.
+- Quote any headline that seems fake or manipulative, with a short reason.
+- Describe the trend and overall tone of this part in two or three sentences.
+Be brief; your notes will be merged with notes on the other parts.
+
+News:
+{news}
+"""
+
+
+def fake_check_merge_prompt(notes: List[str]) -> str:
+    parts = "\n\n".join(notes)
+    return f"""
+Below are notes from an AI truth checker on several parts of a larger set of
+news headlines. Merge them into one set of notes in the same style: keep every
+headline flagged as fake or manipulative, and condense the trend and tone.
+
+Notes:
+{parts}
+"""
+
+
+def fake_check_reduce_prompt(notes: List[str], failed: int = 0) -> str:
+    parts = "\n\n".join(f"Part {i}:\n{note}" for i, note in enumerate(notes, start=1))
+    missing = (
+        f"- Say first that {failed} more part(s) could not be analyzed, so this check is incomplete.\n"
+        if failed else ""
+    )
+    return f"""
+You are an AI truth checker and wellness advisor. A large set of news headlines
+was split into {len(notes) + failed} parts and each part was analyzed separately. Using
+the notes below:
+{missing}- List the headlines that seem fake or manipulative.
+- Summarize the overall trend across all parts.
+- Provide mental wellness tips if sentiment is negative.
+
+Notes:
+{parts}
+"""
+
+
+def chunk_headlines(headlines: List[str], budget: Optional[int] = None) -> List[List[str]]:
+    """Split headlines, in order, into chunks of at most ~`budget` tokens each."""
+    budget = budget or FAKE_CHECK_CHUNK_TOKENS
+    chunks: List[List[str]] = []
+    current: List[str] = []
+    used = 0
+    for headline in headlines:
+        tokens = estimate_tokens(headline) + 1
+        if current and used + tokens > budget:
+            chunks.append(current)
+            current, used = [], 0
+        current.append(headline)
+        used += tokens
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def fake_check(news_list: str, on_text: Optional[Callable[[str], None]] = None) -> str:
+    """Fake-news / wellness analysis of newline-separated headlines.
+
+    Headline sets over FAKE_CHECK_CHUNK_TOKENS are checked chunk by chunk in
+    parallel, then merged by one final call. With `on_text`, that final call
+    streams and `on_text` gets the text so far after every delta.
+
+    Raises on API errors so each caller can surface them its own way.
+    """
+    # Keyed by the headline set, so the same stories in a different order still hit.
+    cache_key = "fake-check:\n" + "\n".join(sorted(set(news_list.splitlines())))
+    cached = llm_cache.get(GROQ_MODEL, cache_key)
+    if cached is None:
+        streamed = []
+
+        def stream_to_caller(text: str) -> None:
+            streamed.append(True)
+            on_text(text)
+
+        cached = groq_flights.do(
+            (GROQ_MODEL, cache_key), _call_fake_check, news_list, cache_key,
+            stream_to_caller if on_text else None,
+        )
+        if streamed:
+            return cached
+    # Cache hits, and callers who shared another session's call, get it in one piece.
+    if on_text:
+        on_text(cached)
+    return cached
+
+
+def _call_fake_check(news_list: str, cache_key: str, on_text: Optional[Callable[[str], None]]) -> str:
+    chunks = chunk_headlines([line for line in news_list.splitlines() if line.strip()])
+    failed = 0
+    if len(chunks) <= 1:
+        prompt = fake_check_prompt(news_list)
+    else:
+        notes, lost = _map_fake_check(chunks, fake_check_map_prompt)
+        failed += len(lost)
+        # Many parts can leave more notes than one prompt should hold; merge
+        # them in rounds until the final prompt fits the same budget.
+        while len(notes) > 1 and estimate_tokens(fake_check_reduce_prompt(notes, failed)) > FAKE_CHECK_CHUNK_TOKENS:
+            groups = chunk_headlines(notes)
+            if len(groups) == len(notes):  # every note is a chunk of its own; merging can't shrink it
+                break
+            notes, lost = _map_fake_check(groups, fake_check_merge_prompt)
+            failed += sum(len(group) for group in lost)  # one note per part it stood for
+        prompt = fake_check_reduce_prompt(notes, failed)
+
+    tokens = estimate_tokens(prompt) + FAKE_CHECK_COMPLETION_TOKENS
+    if on_text is None:
+        response = chat("fake_check", prompt, tokens)
+        result = response.choices[0].message.content.strip()
+    else:
+        text = ""
+        for delta in chat_stream("fake_check", prompt, tokens):
+            text += delta
+            on_text(text)
+        result = text.strip()
+    if not failed:  # an answer missing parts is not cached, so the next check retries them
+        llm_cache.set(GROQ_MODEL, cache_key, result)
+    return result
+
+
+def _map_fake_check(
+    chunks: List[List[str]], make_prompt: Callable[[List[str]], str]
+) -> Tuple[List[str], List[List[str]]]:
+    """Notes for the chunks whose call succeeded, in order, and the chunks left out because theirs failed."""
+    notes: List[Optional[str]] = [None] * len(chunks)
+    errors = []
+    with ThreadPoolExecutor(max_workers=min(GROQ_MAX_WORKERS, len(chunks))) as pool:
+        futures = {
+            pool.submit(contextvars.copy_context().run, _fake_check_notes, make_prompt(chunk)): i
+            for i, chunk in enumerate(chunks)
+        }
+        for future in as_completed(futures):
+            try:
+                notes[futures[future]] = future.result()
+            except Exception as e:
+                errors.append(e)
+    if errors and len(errors) == len(chunks):
+        raise errors[0]
+    if errors:
+        metrics.inc("groq_fake_check_failed_chunks_total", len(errors))
+    failed = [chunk for chunk, note in zip(chunks, notes) if note is None]
+    return [note for note in notes if note is not None], failed
+
+
+def _fake_check_notes(prompt: str) -> str:
+    cached = llm_cache.get(GROQ_MODEL, prompt)
+    if cached is not None:
+        return cached
+    return groq_flights.do((GROQ_MODEL, prompt), _call_fake_check_notes, prompt)
+
+
+def _call_fake_check_notes(prompt: str) -> str:
+    tokens = estimate_tokens(prompt) + FAKE_CHECK_NOTES_TOKENS
+    response = chat("fake_check_map", prompt, tokens, max_tokens=FAKE_CHECK_NOTES_TOKENS)
+    notes = response.choices[0].message.content.strip()
+    llm_cache.set(GROQ_MODEL, prompt, notes)
+    return notes
@@ -0,0 +1,215 @@
+# ai_news_verifier_app/metrics.py
+"""Lightweight stage timing and counters, exportable as Prometheus text or JSON lines.
+
+    with metrics.trace("analyze", keyword=keyword) as t:   # one per query
+        with metrics.span("fetch"):
+            ...
+        metrics.inc("groq_prompt_tokens_total", 123)
+
+Spans feed process-wide per-stage totals and, when inside a trace, that
+trace's breakdown. When a trace ends it is appended to METRICS_JSONL_PATH
+and the Prometheus text file at METRICS_PROM_PATH is rewritten (either is
+skipped when its variable is unset).
+"""
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional, Tuple
+
+METRICS_JSONL_PATH = os.getenv("METRICS_JSONL_PATH")
+METRICS_PROM_PATH = os.getenv("METRICS_PROM_PATH")
+METRICS_PREFIX = "news_"
+
+COUNTER_HELP = {
+    "groq_requests_total": "Groq chat completion requests, by kind.",
+    "groq_errors_total": "Groq requests that still failed after retries, by kind.",
+    "groq_retries_total": "Groq requests retried after a 408/409/429/5xx or connection error, by kind.",
+    "groq_prompt_tokens_total": "Prompt tokens reported by Groq.",
+    "groq_completion_tokens_total": "Completion tokens reported by Groq.",
+    "groq_fallback_requests_total": "Single-article summary calls made after a batch missed articles.",
+    "groq_fake_check_failed_chunks_total": "Fake-check parts left out of the final answer after their Groq call failed.",
+    "groq_rate_limit_wait_seconds_total": "Seconds spent waiting on the local Groq rate limiter.",
+    "fetch_retries_total": "Upstream news fetch retries, by source.",
+    "fetch_errors_total": "Upstream news fetches that failed after retries, by source.",
+    "fetch_timeouts_total": "Source fetches abandoned after the source's timeout, by source.",
+    "source_bad_records_total": "Local source records skipped as unreadable, by source.",
+    "singleflight_leader_total": "Calls that ran the work themselves, by single-flight group.",
+    "singleflight_shared_total": "Calls that waited for an identical in-flight call instead, by group.",
+    "session_snapshot_hits_total": "Reruns that re-rendered a stored analysis snapshot instead of recomputing.",
+    "session_snapshot_evictions_total": "Analysis snapshots evicted to keep a session under its caps.",
+}
+
+GAUGE_HELP = {
+    "singleflight_waiters": "Callers currently waiting on an in-flight call, by single-flight group.",
+}
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class Trace:
+    """Stage spans recorded for one query."""
+
+    def __init__(self, name: str, **fields):
+        self.name = name
+        self.fields = fields
+        self.started = time.time()
+        self.spans: List[Tuple[str, float]] = []
+        self.kept = True
+
+    def discard(self) -> None:
+        """Neither time nor export this trace, e.g. a rerun that did no work."""
+        self.kept = False
+
+    def totals(self) -> Dict[str, float]:
+        totals: Dict[str, float] = {}
+        for stage, seconds in self.spans:
+            totals[stage] = totals.get(stage, 0.0) + seconds
+        return totals
+
+
+class Registry:
+    """Thread-safe process-wide counters, gauges and per-stage timing totals."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counters: Dict[Tuple[str, Labels], float] = {}
+        self.gauges: Dict[Tuple[str, Labels], float] = {}
+        self.stages: Dict[str, List[float]] = {}  # stage -> [count, total seconds, max seconds]
+
+    def inc(self, name: str, value: float = 1.0, **labels) -> None:
+        key = (name, tuple(sorted((k, str(v)) for k, v in labels.items())))
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0.0) + value
+
+    def set_gauge(self, name: str, value: float, **labels) -> None:
+        key = (name, tuple(sorted((k, str(v)) for k, v in labels.items())))
+        with self.lock:
+            self.gauges[key] = value
+
+    def observe(self, stage: str, seconds: float) -> None:
+        with self.lock:
+            stats = self.stages.setdefault(stage, [0, 0.0, 0.0])
+            stats[0] += 1
+            stats[1] += seconds
+            stats[2] = max(stats[2], seconds)
+
+    def snapshot(self) -> dict:
+        with self.lock:
+            counters = {
+                name + ("{" + ",".join(f"{k}={v}" for k, v in labels) + "}" if labels else ""): value
+                for (name, labels), value in sorted(self.counters.items())
+            }
+            gauges = {
+                name + ("{" + ",".join(f"{k}={v}" for k, v in labels) + "}" if labels else ""): value
+                for (name, labels), value in sorted(self.gauges.items())
+            }
+            stages = {
+                stage: {"count": int(c), "total_seconds": round(t, 6), "max_seconds": round(m, 6)}
+                for stage, (c, t, m) in sorted(self.stages.items())
+            }
+        return {"counters": counters, "gauges": gauges, "stages": stages}
+
+    def prometheus_text(self) -> str:
+        lines = []
+        with self.lock:
+            counters = sorted(self.counters.items())
+            gauges = sorted(self.gauges.items())
+            stages = sorted(self.stages.items())
+
+        for kind, help_text, series in (("counter", COUNTER_HELP, counters), ("gauge", GAUGE_HELP, gauges)):
+            seen = set()
+            for (name, labels), value in series:
+                full = METRICS_PREFIX + name
+                if name not in seen:
+                    seen.add(name)
+                    lines.append(f"# HELP {full} {help_text.get(name, name)}")
+                    lines.append(f"# TYPE {full} {kind}")
+                label_text = ",".join(f'{k}="{v}"' for k, v in labels)
+                lines.append(f"{full}{{{label_text}}} {value:g}" if labels else f"{full} {value:g}")
+
+        if stages:
+            full = METRICS_PREFIX + "stage_seconds"
+            lines.append(f"# HELP {full} Time spent per pipeline stage.")
+            lines.append(f"# TYPE {full} summary")
+            for stage, (count, total, _) in stages:
+                lines.append(f'{full}_sum{{stage="{stage}"}} {total:.6f}')
+                lines.append(f'{full}_count{{stage="{stage}"}} {int(count)}')
+            full = METRICS_PREFIX + "stage_max_seconds"
+            lines.append(f"# HELP {full} Slowest single span per pipeline stage.")
+            lines.append(f"# TYPE {full} gauge")
+            for stage, (_, _, longest) in stages:
+                lines.append(f'{full}{{stage="{stage}"}} {longest:.6f}')
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+_current_trace: ContextVar[Optional[Trace]] = ContextVar("current_trace", default=None)
+_export_lock = threading.Lock()
+
+
+def inc(name: str, value: float = 1.0, **labels) -> None:
+    registry.inc(name, value, **labels)
+
+
+def set_gauge(name: str, value: float, **labels) -> None:
+    registry.set_gauge(name, value, **labels)
+
+
+@contextmanager
+def span(stage: str) -> Iterator[None]:
+    """Time a block under `stage`, globally and in the current trace if any."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(stage, time.perf_counter() - start)
+
+
+def observe(stage: str, seconds: float) -> None:
+    """Record an already measured duration, like a finished span."""
+    registry.observe(stage, seconds)
+    current = _current_trace.get()
+    if current is not None:
+        current.spans.append((stage, seconds))
+
+
+def current_trace() -> Optional[Trace]:
+    return _current_trace.get()
+
+
+@contextmanager
+def trace(name: str, **fields) -> Iterator[Trace]:
+    """Collect the spans of one query, then export them unless it was discarded."""
+    t = Trace(name, **fields)
+    token = _current_trace.set(t)
+    start = time.perf_counter()
+    try:
+        yield t
+    finally:
+        if t.kept:
+            observe(name, time.perf_counter() - start)
+        _current_trace.reset(token)
+        if t.kept:
+            export(t)
+
+
+def export(t: Trace) -> None:
+    with _export_lock:
+        if METRICS_JSONL_PATH:
+            record = {
+                "ts": round(t.started, 3),
+                "trace": t.name,
+                **t.fields,
+                "stages": {k: round(v, 6) for k, v in t.totals().items()},
+            }
+            with open(METRICS_JSONL_PATH, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        if METRICS_PROM_PATH:
+            # Write-then-rename so a scraper never reads a half-written file.
+            tmp = f"{METRICS_PROM_PATH}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(registry.prometheus_text())
+            os.replace(tmp, METRICS_PROM_PATH)
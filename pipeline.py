@@ -0,0 +1,86 @@
+# ai_news_verifier_app/pipeline.py
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from llm import iter_summaries
+from sentiment import analyze_sentiment_batch, label_sentiment
+
+
+class Article:
+    """One news item as it moves through the pipeline.
+
+    Stages fill the fields in order: normalize (source, title, description,
+    url, published) -> dedup (sources) -> score (polarity) -> label ->
+    summarize (summary).
+    """
+
+    __slots__ = (
+        "source", "title", "description", "url", "published", "sources",
+        "polarity", "label", "summary",
+    )
+
+    def __init__(self, source: str, title: str, description: str, url: str, published: str = ""):
+        self.source = source
+        self.title = title
+        self.description = description
+        self.url = url
+        self.published = published
+        self.sources = [source]  # one entry per copy once near-duplicates are collapsed
+        self.polarity: Optional[float] = None
+        self.label: Optional[str] = None
+        self.summary: Optional[str] = None
+
+    @property
+    def text(self) -> str:
+        """Title + description: what gets scored, labeled and summarized."""
+        return f"{self.title} {self.description}"
+
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+# --- STAGES ---
+
+def normalize(source: str, items: Iterable[dict]) -> List[Article]:
+    """Turn items from `source`, in the source adapters' common schema, into Article records."""
+    return [
+        Article(
+            source=source,
+            title=item.get("title", "") or "",
+            description=item.get("description", "") or "",
+            url=item.get("url", "") or "",
+            published=item.get("published", "") or "",
+        )
+        for item in items
+    ]
+
+
+def score(articles: List[Article]) -> List[Article]:
+    for article, polarity in zip(articles, analyze_sentiment_batch([a.text for a in articles])):
+        article.polarity = polarity
+    return articles
+
+
+def label(articles: List[Article]) -> List[Article]:
+    for article in articles:
+        article.label = label_sentiment(article.polarity, article.text)
+    return articles
+
+
+def summarize_iter(articles: List[Article]) -> Iterator[Article]:
+    """Fill in summaries, yielding each article as soon as its summary lands."""
+    for i, summary in iter_summaries([a.text for a in articles]):
+        articles[i].summary = summary
+        yield articles[i]
+
+
+def summarize(articles: List[Article]) -> List[Article]:
+    for _ in summarize_iter(articles):
+        pass
+    return articles
+
+
+def label_counts(articles: List[Article]) -> Dict[str, int]:
+    counts = {"Positive": 0, "Neutral": 0, "Negative": 0}
+    for article in articles:
+        counts[article.label] += 1
+    return counts
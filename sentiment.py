@@ -0,0 +1,162 @@
+# ai_news_verifier_app/sentiment.py
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional
+
+import numpy as np
+
+from crisis import has_crisis_keyword
+
+# Above this many texts, analyze_sentiment_batch spreads chunks over processes.
+SENTIMENT_PROCESS_THRESHOLD = int(os.getenv("SENTIMENT_PROCESS_THRESHOLD", "20000"))
+SENTIMENT_CHUNK_SIZE = 5000
+
+# Batch polarity equals analyze_sentiment() up to float summation order; both
+# round to 7 places, so results agree to within one unit in the last place.
+SENTIMENT_BATCH_TOLERANCE = 1e-7
+
+
+def analyze_sentiment(text: str) -> float:
+    """Return TextBlob polarity score."""
+    from textblob import TextBlob  # textblob pulls in nltk; load it on first use
+
+    return round(TextBlob(text).sentiment.polarity, 7)
+
+
+def label_sentiment(score: float, text: str) -> str:
+    """Convert score + text into Positive / Neutral / Negative."""
+    # Base thresholds (more sensitive)
+    if score > 0.1:
+        label = "Positive"
+    elif score < -0.1:
+        label = "Negative"
+    else:
+        label = "Neutral"
+
+    # Crisis override: if text clearly mentions bad stuff, force Negative
+    if has_crisis_keyword(text):
+        label = "Negative"
+
+    return label
+
+
+# --- BATCH SCORING ---
+#
+# TextBlob's default analyzer (pattern's Sentiment) averages the polarity of
+# every lexicon word in the text, where an adverb from the lexicon ("very")
+# folds into the next known word and scales it by its intensity. That part is
+# reproduced below with NumPy over one flat token array for the whole batch.
+# The rarer rules (negations, "!" boosts, emoticons, "(!)") are left to
+# pattern itself: texts that contain them go through its assessments() on the
+# tokens we already have.
+
+class _Lexicon:
+    __slots__ = ("analyzer", "index", "polarity", "intensity", "modifier", "fallback_tokens")
+
+    def __init__(self):
+        from textblob._text import EMOTICONS
+        from textblob.en import sentiment as pattern_sentiment
+
+        self.analyzer = pattern_sentiment
+        if dict.__len__(pattern_sentiment) == 0:
+            pattern_sentiment.load()
+        entries = dict.items(pattern_sentiment)
+        self.index = {word: i for i, (word, _) in enumerate(entries)}
+        self.polarity = np.array([tags[None][0] for _, tags in entries], dtype=np.float64)
+        self.intensity = np.array([tags[None][2] for _, tags in entries], dtype=np.float64)
+        self.modifier = np.array(
+            [any(tag in tags for tag in pattern_sentiment.modifiers) for _, tags in entries],
+            dtype=bool,
+        )
+        self.fallback_tokens = (
+            set(pattern_sentiment.negations)
+            | {"!", "(!)"}
+            | {e.lower() for faces in EMOTICONS.values() for e in faces}
+        )
+
+
+_lexicon: Optional[_Lexicon] = None
+
+
+def _get_lexicon() -> _Lexicon:
+    global _lexicon
+    if _lexicon is None:
+        _lexicon = _Lexicon()
+    return _lexicon
+
+
+def _tokenize(lex: _Lexicon, text: str) -> List[str]:
+    # Same tokenization TextBlob applies before scoring.
+    return [w.lower() for w in " ".join(lex.analyzer.tokenizer(text)).split()]
+
+
+def _exact_polarity(lex: _Lexicon, tokens: List[str]) -> float:
+    # What TextBlob(text).sentiment.polarity computes, minus the re-tokenizing.
+    a = lex.analyzer.assessments(((w, None) for w in tokens), negation=True)
+    return round(sum(p for _, p, _, _ in a) / float(len(a) or 1), 7)
+
+
+def _score_chunk(texts: List[str]) -> List[float]:
+    lex = _get_lexicon()
+    ids: List[int] = []       # lexicon index per token, -1 if unknown
+    breaks: List[bool] = []   # unknown words longer than 2 chars end a modifier
+    lengths = np.zeros(len(texts), dtype=np.int64)
+    exact = {}
+
+    for doc, text in enumerate(texts):
+        tokens = _tokenize(lex, text)
+        if not lex.fallback_tokens.isdisjoint(tokens):
+            exact[doc] = _exact_polarity(lex, tokens)
+            continue
+        for token in tokens:
+            i = lex.index.get(token, -1)
+            ids.append(i)
+            breaks.append(i < 0 and len(token) > 2)
+        lengths[doc] = len(tokens)
+
+    ids_arr = np.array(ids, dtype=np.int64)
+    doc_of = np.repeat(np.arange(len(texts)), lengths)
+    known = ids_arr >= 0
+    breaks_before = np.cumsum(np.array(breaks, dtype=np.int64))
+
+    pos = np.flatnonzero(known)   # positions of known words
+    word = ids_arr[pos]
+    doc = doc_of[pos]
+    p = lex.polarity[word]
+
+    # A known word continues the previous assessment when the previous known
+    # word (same text) is a modifier and no long unknown word sits between them.
+    cont = np.zeros(len(pos), dtype=bool)
+    if len(pos) > 1:
+        gap_breaks = breaks_before[pos[1:] - 1] - breaks_before[pos[:-1]]
+        cont[1:] = (doc[1:] == doc[:-1]) & lex.modifier[word[:-1]] & (gap_breaks == 0)
+
+    value = p.copy()
+    value[1:] = np.where(cont[1:], np.clip(p[1:] * lex.intensity[word[:-1]], -1.0, 1.0), p[1:])
+
+    # Each assessment keeps the value of its last word; count one per start.
+    last = np.ones(len(pos), dtype=bool)
+    last[:-1] = ~cont[1:]
+    sums = np.bincount(doc[last], weights=value[last], minlength=len(texts))
+    counts = np.bincount(doc[~cont], minlength=len(texts))
+    polarity = np.divide(sums, counts, out=np.zeros(len(texts)), where=counts > 0)
+
+    scores = [round(float(x), 7) for x in polarity]
+    for i, score in exact.items():
+        scores[i] = score
+    return scores
+
+
+def analyze_sentiment_batch(texts: List[str], processes: Optional[int] = None) -> List[float]:
+    """Polarity for many texts at once, in input order.
+
+    Matches `analyze_sentiment` per text within SENTIMENT_BATCH_TOLERANCE, so
+    `label_sentiment` gives the same labels. Inputs larger than
+    SENTIMENT_PROCESS_THRESHOLD are split across a process pool.
+    """
+    texts = list(texts)
+    if len(texts) < SENTIMENT_PROCESS_THRESHOLD:
+        return _score_chunk(texts)
+    chunks = [texts[i:i + SENTIMENT_CHUNK_SIZE] for i in range(0, len(texts), SENTIMENT_CHUNK_SIZE)]
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        return [score for chunk in pool.map(_score_chunk, chunks) for score in chunk]
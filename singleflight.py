@@ -0,0 +1,94 @@
+# ai_news_verifier_app/singleflight.py
+"""Process-wide coalescing of identical in-flight calls.
+
+    flights = SingleFlight("collect")
+    articles = flights.do(("ai", 3), collect, "ai", 3)
+
+The first caller for a key runs the work. Anyone who asks for the same key
+before it finishes waits and gets the same result (or the same exception)
+rather than starting the work again. If the leader is interrupted rather
+than failing, one of the waiters takes over. Nothing is kept once the call
+finishes; caching is left to the layers underneath.
+"""
+import threading
+from typing import Any, Callable, Dict, Hashable, List
+
+import metrics
+
+
+class _Call:
+    __slots__ = ("done", "result", "error", "abandoned", "waiters")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Any = None
+        self.abandoned = False
+        self.waiters = 0
+
+
+class SingleFlight:
+    """One group of coalesced calls; `name` labels its metrics."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.lock = threading.Lock()
+        self.calls: Dict[Hashable, _Call] = {}
+        _groups.append(self)
+
+    def do(self, key: Hashable, fn: Callable, *args, **kwargs):
+        with self.lock:
+            call = self.calls.get(key)
+            leader = call is None
+            if leader:
+                call = self.calls[key] = _Call()
+            else:
+                call.waiters += 1
+                self._publish_waiters()
+
+        if not leader:
+            metrics.inc("singleflight_shared_total", group=self.name)
+            with metrics.span(f"singleflight_wait_{self.name}"):
+                call.done.wait()
+            if call.abandoned:
+                return self.do(key, fn, *args, **kwargs)
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        metrics.inc("singleflight_leader_total", group=self.name)
+        try:
+            call.result = fn(*args, **kwargs)
+            return call.result
+        except Exception as e:
+            call.error = e
+            raise
+        except BaseException:
+            # The leader itself was stopped (e.g. a Streamlit rerun or Ctrl-C);
+            # that is not the waiters' outcome, so they start over.
+            call.abandoned = True
+            raise
+        finally:
+            with self.lock:
+                del self.calls[key]
+                self._publish_waiters()
+            call.done.set()
+
+    def waiters(self) -> Dict[Hashable, int]:
+        """Callers currently waiting, per in-flight key (0: only the leader)."""
+        with self.lock:
+            return {key: call.waiters for key, call in self.calls.items()}
+
+    def _publish_waiters(self) -> None:
+        # Caller holds self.lock.
+        metrics.set_gauge(
+            "singleflight_waiters", sum(call.waiters for call in self.calls.values()), group=self.name
+        )
+
+
+_groups: List[SingleFlight] = []
+
+
+def in_flight() -> Dict[str, Dict[Hashable, int]]:
+    """Waiter counts per in-flight key, for every group in the process."""
+    return {group.name: group.waiters() for group in _groups}
@@ -0,0 +1,156 @@
+# ai_news_verifier_app/snapshots.py
+"""Per-session snapshots of finished analyses, so reruns re-render instead of recompute.
+
+    snapshots = st.session_state.setdefault("snapshots", SnapshotCache())
+    snapshots.put(new_snapshot(keyword, days, articles))
+    analysis = snapshots.get(keyword, days)  # None: not analyzed in this session
+
+Streamlit reruns the whole script on every widget interaction. A snapshot
+keeps what one analysis produced (scored articles, summaries so far, the
+fake-news check and the timeline buckets) keyed by (keyword, days), so
+going back to an earlier keyword or slider value shows it again without
+fetching or calling Groq. Charts are not kept; they come back from the
+process-wide chart cache.
+
+Snapshots are compact: articles are copied without the fields rendering
+doesn't need, and a description is dropped once the article has its
+summary. Each session holds at most SESSION_SNAPSHOT_MAX_ENTRIES snapshots
+and roughly SESSION_SNAPSHOT_MAX_BYTES; past either, the least recently
+viewed ones are evicted. The snapshot being viewed is never evicted, even
+when it is over the byte cap on its own.
+"""
+import os
+import sys
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import metrics
+from pipeline import Article
+from store import keyword_key
+
+SESSION_SNAPSHOT_MAX_ENTRIES = max(1, int(os.getenv("SESSION_SNAPSHOT_MAX_ENTRIES", "8")))
+SESSION_SNAPSHOT_MAX_BYTES = int(os.getenv("SESSION_SNAPSHOT_MAX_BYTES", str(4 * 2**20)))
+
+SnapshotKey = Tuple[str, int]
+
+
+def snapshot_key(keyword: str, days: int) -> SnapshotKey:
+    return keyword_key(keyword), days
+
+
+def compact_article(article: Article) -> Article:
+    """Copy of `article` holding only what rendering and on-view summarizing use."""
+    copy = Article(
+        article.source,
+        article.title,
+        article.description if article.summary is None else "",
+        article.url,
+        article.published,
+    )
+    copy.sources = list(article.sources)
+    copy.polarity, copy.label, copy.summary = article.polarity, article.label, article.summary
+    return copy
+
+
+def new_snapshot(keyword: str, days: int, articles: List[Article], shown: int) -> dict:
+    """Snapshot of a fresh analysis; its articles are compact copies owned by the snapshot."""
+    return {
+        "keyword": keyword,
+        "days": days,
+        "articles": [compact_article(article) for article in articles],
+        "shown": shown,
+        "ai_response": None,
+        "timeline": None,
+    }
+
+
+def _article_bytes(article: Article) -> int:
+    size = sys.getsizeof(article) + sys.getsizeof(article.sources)
+    for value in (article.title, article.description, article.url, article.published, article.summary):
+        size += sys.getsizeof(value)
+    return size
+
+
+def snapshot_bytes(snapshot: dict) -> int:
+    """Approximate memory held by one snapshot."""
+    size = sys.getsizeof(snapshot) + sys.getsizeof(snapshot["articles"])
+    size += sum(_article_bytes(article) for article in snapshot["articles"])
+    size += sys.getsizeof(snapshot["ai_response"])
+    result = snapshot["timeline"]
+    if result is not None:
+        size += sum(sys.getsizeof(bucket) for bucket in result["buckets"]) + sys.getsizeof(result)
+    return size
+
+
+class SnapshotCache:
+    """LRU of one session's analysis snapshots, capped by count and approximate bytes."""
+
+    def __init__(
+        self,
+        max_entries: int = SESSION_SNAPSHOT_MAX_ENTRIES,
+        max_bytes: int = SESSION_SNAPSHOT_MAX_BYTES,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.memory: "OrderedDict[SnapshotKey, dict]" = OrderedDict()
+        self.sizes: Dict[SnapshotKey, int] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+
+    def get(self, keyword: str, days: int) -> Optional[dict]:
+        key = snapshot_key(keyword, days)
+        with self.lock:
+            snapshot = self.memory.get(key)
+            if snapshot is None:
+                self.misses += 1
+                return None
+            self.memory.move_to_end(key)
+            self.hits += 1
+        metrics.inc("session_snapshot_hits_total")
+        return snapshot
+
+    def put(self, snapshot: dict) -> None:
+        """Store (or re-measure, after it changed) a snapshot and make it the most recent.
+
+        Descriptions of articles summarized since the last put are dropped first.
+        """
+        for article in snapshot["articles"]:
+            if article.summary is not None and article.description:
+                article.description = ""
+        key = snapshot_key(snapshot["keyword"], snapshot["days"])
+        size = snapshot_bytes(snapshot)
+        with self.lock:
+            self.memory[key] = snapshot
+            self.memory.move_to_end(key)
+            self.sizes[key] = size
+            evicted = 0
+            while len(self.memory) > 1 and (
+                len(self.memory) > self.max_entries or sum(self.sizes.values()) > self.max_bytes
+            ):
+                oldest, _ = self.memory.popitem(last=False)
+                del self.sizes[oldest]
+                evicted += 1
+            self.evictions += evicted
+        if evicted:
+            metrics.inc("session_snapshot_evictions_total", evicted)
+
+    def stats(self) -> dict:
+        with self.lock:
+            return {
+                "entries": len(self.memory),
+                "bytes": sum(self.sizes.values()),
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "keys": [f"{keyword!r}, {days}d" for keyword, days in self.memory],
+            }
+
+    def clear(self) -> None:
+        with self.lock:
+            self.memory.clear()
+            self.sizes.clear()
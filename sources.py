@@ -0,0 +1,395 @@
+# ai_news_verifier_app/sources.py
+"""Source adapters: every place articles come from, behind one interface.
+
+    fetched, errors = fetch_all(keyword, days)           # every registered source, concurrently
+    for page in SOURCES["rss"].pages(keyword, days, 500):  # or walk one source page by page
+        ...
+
+An adapter returns items in one schema, whatever the upstream calls its
+fields:
+
+    {"title": ..., "description": ..., "url": ..., "published": "2026-10-17T08:00:00Z"}
+
+Registered by default are the NewsAPI and Polygon APIs, plus local RSS/Atom
+files (SOURCE_RSS_PATHS) and JSONL dumps (SOURCE_JSONL_PATHS) when those
+are set. Both take os.pathsep-separated glob patterns, re-expanded on every
+query, so files dropped into a folder are picked up without a restart.
+Local files are streamed item by item and filtered by keyword and date
+window as they are read, so large offline corpora go through at disk speed
+without being loaded whole. Items without a usable date are skipped there,
+since they cannot be placed in a look-back window.
+
+Each adapter has its own `timeout` (seconds for one fan-out fetch),
+`walk_timeout` (seconds for a full page-by-page walk) and `budget` (most
+items per query). A source that runs over its timeout is reported like a
+failed one and left to finish in the background; the others are not held up.
+Add a source with `register(adapter)`; the analysis loop, the store and the
+timeline pick it up by name.
+"""
+import contextvars
+import glob
+import html
+import json
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import metrics
+from fetchers import (
+    FETCH_ARTICLE_BUDGET,
+    FetchError,
+    fetch_newsapi_news,
+    fetch_polygon_news,
+    iter_newsapi_pages,
+    iter_polygon_pages,
+)
+
+SOURCE_TIMEOUT = float(os.getenv("SOURCE_TIMEOUT", "30"))
+SOURCE_WALK_TIMEOUT = float(os.getenv("SOURCE_WALK_TIMEOUT", "300"))
+SOURCE_RSS_PATHS = os.getenv("SOURCE_RSS_PATHS", "")
+SOURCE_JSONL_PATHS = os.getenv("SOURCE_JSONL_PATHS", "")
+LOCAL_PAGE_SIZE = 500  # items per page when walking a local source
+
+# (since, until) timestamps to fetch between; None leaves that end open.
+Window = Tuple[Optional[str], Optional[str]]
+
+
+def iso_timestamp(value: str) -> str:
+    """ISO 8601 or RFC 822 date -> "YYYY-MM-DDTHH:MM:SSZ" in UTC, or "" when unparseable.
+
+    Naive timestamps are taken as UTC.
+    """
+    value = (value or "").strip()
+    if not value:
+        return ""
+    try:
+        moment = datetime.fromisoformat(value)
+    except ValueError:
+        try:
+            moment = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return ""
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _plain_text(value: str) -> str:
+    # Feed descriptions are often HTML; keep the words only.
+    return " ".join(html.unescape(re.sub(r"<[^>]+>", " ", value or "")).split())
+
+
+class SourceAdapter:
+    """One article source. Subclasses set `name` and implement `fetch`; `pages` is optional."""
+
+    name = ""
+
+    def __init__(
+        self,
+        timeout: float = SOURCE_TIMEOUT,
+        walk_timeout: float = SOURCE_WALK_TIMEOUT,
+        budget: int = FETCH_ARTICLE_BUDGET,
+    ):
+        self.timeout = timeout
+        self.walk_timeout = walk_timeout
+        self.budget = budget
+
+    def fetch(self, keyword: str, days: int, since: Optional[str] = None, until: Optional[str] = None) -> List[dict]:
+        """Items for `keyword` over the last `days` days, or between `since` and `until` when given."""
+        raise NotImplementedError
+
+    def pages(self, keyword: str, days: int, budget: int) -> Iterator[List[dict]]:
+        """Every item for the window, one page at a time, stopping at `budget` items.
+
+        The default is a single page from `fetch`.
+        """
+        items = self.fetch(keyword, days)[:budget]
+        if items:
+            yield items
+
+
+class APIAdapter(SourceAdapter):
+    """A remote news API given as a fetch function and a page generator over its raw items."""
+
+    def __init__(
+        self,
+        name: str,
+        fetch: Callable[..., List[dict]],
+        pages: Callable[..., Iterator[List[dict]]],
+        url_field: str,
+        published_field: str,
+        **limits,
+    ):
+        super().__init__(**limits)
+        self.name = name
+        self._fetch = fetch
+        self._pages = pages
+        self.url_field = url_field
+        self.published_field = published_field
+
+    def item(self, raw: dict) -> dict:
+        return {
+            "title": raw.get("title") or "",
+            "description": raw.get("description") or "",
+            "url": raw.get(self.url_field) or "",
+            "published": raw.get(self.published_field) or "",
+        }
+
+    def fetch(self, keyword, days, since=None, until=None):
+        if since is not None:
+            # A bounded window is one the store will mark as covered: walk all of
+            # it, since the single fixed-size page could stop short of `since`.
+            return [
+                self.item(raw)
+                for page in self._pages(keyword, days, self.budget, since, until)
+                for raw in page
+            ]
+        return [self.item(raw) for raw in self._fetch(keyword, days, since, until)]
+
+    def pages(self, keyword, days, budget):
+        for page in self._pages(keyword, days, budget):
+            yield [self.item(raw) for raw in page]
+
+
+class FileAdapter(SourceAdapter):
+    """Local files matched by glob patterns, read lazily and filtered as they stream past."""
+
+    def __init__(self, name: str, patterns: Sequence[str], **limits):
+        super().__init__(**limits)
+        self.name = name
+        self.patterns = [pattern for pattern in patterns if pattern]
+
+    def paths(self) -> List[str]:
+        paths = sorted({path for pattern in self.patterns for path in glob.glob(os.path.expanduser(pattern))})
+        if not paths:
+            raise FetchError(f"no files match {os.pathsep.join(self.patterns)}")
+        return paths
+
+    def read(self, path: str, words: Sequence[str] = ()) -> Iterator[dict]:
+        """Items in one file, in the common schema.
+
+        Items whose raw text lacks one of the lowercase `words` may be
+        skipped before they are parsed any further; `matching` checks the rest.
+        """
+        raise NotImplementedError
+
+    def matching(self, keyword: str, days: int, since: Optional[str] = None, until: Optional[str] = None) -> Iterator[dict]:
+        words = keyword.lower().split()
+        start = since or (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
+        for path in self.paths():
+            for item in self.read(path, _raw_words(words)):
+                published = item["published"]
+                if not published or published < start or (until and published >= until):
+                    continue
+                text = f"{item['title']} {item['description']}".lower()
+                if all(word in text for word in words):
+                    yield item
+
+    def fetch(self, keyword, days, since=None, until=None):
+        return list(islice(self.matching(keyword, days, since, until), self.budget))
+
+    def pages(self, keyword, days, budget):
+        items = islice(self.matching(keyword, days), budget)
+        while True:
+            page = list(islice(items, LOCAL_PAGE_SIZE))
+            if not page:
+                return
+            yield page
+
+
+def _raw_words(words: Sequence[str]) -> List[str]:
+    # Words that escaping (JSON \uXXXX, HTML entities) can't hide in raw text.
+    return [word for word in words if word.isascii() and word.isalnum()]
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+class RSSAdapter(FileAdapter):
+    """RSS 2.0 and Atom feeds (<item> or <entry> elements, namespaces ignored)."""
+
+    def read(self, path, words=()):
+        from xml.etree.ElementTree import iterparse
+
+        # Finished items are detached from their parent, so memory stays flat on huge feeds.
+        stack = []
+        for event, elem in iterparse(path, events=("start", "end")):
+            if event == "start":
+                stack.append(elem)
+                continue
+            stack.pop()
+            if _local_name(elem.tag) not in ("item", "entry"):
+                continue
+            item = self._entry(elem, words)
+            if stack:
+                stack[-1].remove(elem)
+            if item is not None:
+                yield item
+
+    @staticmethod
+    def _entry(elem, words: Sequence[str]) -> Optional[dict]:
+        children: Dict[str, object] = {}
+        for child in elem:
+            children.setdefault(_local_name(child.tag), child)
+
+        def text(*names: str) -> str:
+            for name in names:
+                child = children.get(name)
+                if child is not None and (child.text or "").strip():
+                    return child.text.strip()
+            return ""
+
+        title, description = text("title"), text("description", "summary", "content", "encoded")
+        raw = f"{title} {description}".lower()
+        if not all(word in raw for word in words):
+            return None
+        url = text("link")
+        if not url:
+            # Atom: <link href="..."/>, preferring rel="alternate" (the default).
+            links = [child for child in elem if _local_name(child.tag) == "link"]
+            for link in links:
+                if link.get("rel", "alternate") == "alternate" and link.get("href"):
+                    url = link.get("href")
+                    break
+            else:
+                url = next((link.get("href") for link in links if link.get("href")), "") or text("guid", "id")
+        return {
+            "title": _plain_text(title),
+            "description": _plain_text(description),
+            "url": url,
+            "published": iso_timestamp(text("pubDate", "published", "updated", "date")),
+        }
+
+
+# JSONL keys tried for each schema field, in order; covers NewsAPI and Polygon dumps too.
+JSONL_FIELDS = {
+    "title": ("title", "headline"),
+    "description": ("description", "summary", "content", "body"),
+    "url": ("url", "link", "article_url"),
+    "published": ("published", "publishedAt", "published_utc", "date"),
+}
+
+
+class JSONLAdapter(FileAdapter):
+    """JSON Lines dumps, one article object per line.
+
+    Lines are checked for the query words before they are decoded, so most
+    of a large dump is never parsed. Lines that aren't JSON objects are skipped.
+    """
+
+    def __init__(self, name: str, patterns: Sequence[str], fields: Dict[str, Tuple[str, ...]] = JSONL_FIELDS, **limits):
+        super().__init__(name, patterns, **limits)
+        self.fields = fields
+
+    def read(self, path, words=()):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                if words:
+                    lowered = line.lower()
+                    if not all(word in lowered for word in words):
+                        continue
+                try:
+                    raw = json.loads(line)
+                except ValueError:
+                    raw = None
+                if not isinstance(raw, dict):
+                    metrics.inc("source_bad_records_total", source=self.name)
+                    continue
+                item = {
+                    field: next((raw[key] for key in keys if raw.get(key)), "")
+                    for field, keys in self.fields.items()
+                }
+                item["title"] = str(item["title"])
+                item["description"] = _plain_text(str(item["description"]))
+                item["published"] = iso_timestamp(str(item["published"]))
+                yield item
+
+
+# --- REGISTRY ---
+
+SOURCES: Dict[str, SourceAdapter] = {}
+
+
+def register(adapter: SourceAdapter) -> SourceAdapter:
+    """Add (or replace) a source under `adapter.name`."""
+    SOURCES[adapter.name] = adapter
+    return adapter
+
+
+def unregister(name: str) -> None:
+    SOURCES.pop(name, None)
+
+
+register(APIAdapter("newsapi", fetch_newsapi_news, iter_newsapi_pages, "url", "publishedAt"))
+register(APIAdapter("polygon", fetch_polygon_news, iter_polygon_pages, "article_url", "published_utc"))
+if SOURCE_RSS_PATHS:
+    register(RSSAdapter("rss", SOURCE_RSS_PATHS.split(os.pathsep)))
+if SOURCE_JSONL_PATHS:
+    register(JSONLAdapter("jsonl", SOURCE_JSONL_PATHS.split(os.pathsep)))
+
+
+# --- FAN-OUT ---
+
+def _timed_fetch(adapter: SourceAdapter, keyword: str, days: int, windows: Iterable[Window]) -> List[dict]:
+    with metrics.span(f"fetch_{adapter.name}"):
+        items: List[dict] = []
+        for since, until in windows:
+            items.extend(adapter.fetch(keyword, days, since, until))
+            if len(items) >= adapter.budget:
+                break
+        return items[:adapter.budget]
+
+
+def fetch_all(
+    keyword: str, days: int, windows: Optional[Dict[str, List[Window]]] = None
+) -> Tuple[Dict[str, List[dict]], Dict[str, str]]:
+    """Fetch every registered source concurrently.
+
+    By default each source is asked for the whole `days` window. `windows`
+    narrows that per source to a list of (since, until) ranges; a source
+    given no ranges is not called.
+
+    Returns (results, errors): a source that fails or runs past its timeout
+    maps to [] in `results` and to its error message in `errors`, so callers
+    still get the other sources.
+    """
+    adapters = list(SOURCES.values())
+    if not adapters:
+        return {}, {}
+    if windows is None:
+        windows = {adapter.name: [(None, None)] for adapter in adapters}
+    results: Dict[str, List[dict]] = {}
+    errors: Dict[str, str] = {}
+    pool = ThreadPoolExecutor(max_workers=len(adapters))
+    start = time.monotonic()
+    try:
+        futures = [
+            (adapter, pool.submit(
+                contextvars.copy_context().run, _timed_fetch, adapter, keyword, days, windows.get(adapter.name, [])
+            ))
+            for adapter in adapters
+        ]
+        for adapter, future in sorted(futures, key=lambda pair: pair[0].timeout):
+            done, _ = wait([future], timeout=max(0.0, start + adapter.timeout - time.monotonic()))
+            if not done:
+                metrics.inc("fetch_timeouts_total", source=adapter.name)
+                results[adapter.name] = []
+                errors[adapter.name] = f"timed out after {adapter.timeout:g}s"
+                continue
+            try:
+                results[adapter.name] = future.result()
+            except Exception as e:
+                results[adapter.name] = []
+                errors[adapter.name] = str(e)
+    finally:
+        # Don't wait for a source that timed out; its result is simply dropped.
+        pool.shutdown(wait=False)
+    return {adapter.name: results[adapter.name] for adapter in adapters}, errors
@@ -0,0 +1,256 @@
+# ai_news_verifier_app/store.py
+"""Local article store: what each keyword has already fetched, scored and summarized.
+
+    windows = article_store.missing_windows(keyword, days)  # what to ask upstream for
+    fetched, errors = fetch_all(keyword, days, windows)
+    article_store.add(keyword, days, fetched, errors)
+    articles = article_store.load(keyword, days, per_source)
+
+Per (keyword, source) the store remembers how far back it has fetched
+(`covered_from`). A repeat query then only asks for articles newer than the
+newest one stored, plus any days the window reaches past `covered_from`
+(widening the slider from 3 to 7 days fetches days 4-7 only). Those bounded
+windows are walked page by page; the first query's single page only counts
+as covering back to its oldest article.
+
+Title and description are indexed with FTS5 for `search`; on SQLite builds
+without FTS5, search falls back to LIKE.
+"""
+import hashlib
+import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+from dedup import canonical_url
+from sources import SOURCES, Window
+from llm import SUMMARY_FALLBACK
+from pipeline import Article, normalize
+
+ARTICLE_STORE_PATH = os.getenv("ARTICLE_STORE_PATH", ".articles.sqlite3")
+# Articles published longer ago than this are pruned; kept above the 31-day slider.
+ARTICLE_STORE_RETENTION_DAYS = max(32, int(os.getenv("ARTICLE_STORE_RETENTION_DAYS", "62")))
+
+_COLUMNS = "id, source, title, description, url, published, polarity, label, summary"
+# The same row through keyword_articles, reporting the source that linked it.
+_LINKED_COLUMNS = ", ".join("k.source" if c == "source" else "a." + c for c in _COLUMNS.split(", "))
+
+
+def keyword_key(keyword: str) -> str:
+    """Case- and whitespace-insensitive form of a query keyword."""
+    return " ".join(keyword.lower().split())
+
+
+def article_key(article: Article) -> str:
+    """Identity of an article in the store: its canonical URL, or a content hash without one."""
+    url = canonical_url(article.url)
+    if url:
+        return url
+    digest = hashlib.sha256(f"{article.title}\0{article.published}".encode("utf-8")).hexdigest()
+    return f"{article.source}:{digest}"
+
+
+def _window_start(days: int) -> str:
+    return (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
+
+
+class ArticleStore:
+    """SQLite store of articles linked to the keywords that found them. Thread-safe."""
+
+    def __init__(self, path: str):
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.executescript(
+            "CREATE TABLE IF NOT EXISTS articles ("
+            " id INTEGER PRIMARY KEY,"
+            " key TEXT NOT NULL UNIQUE,"
+            " source TEXT NOT NULL,"
+            " title TEXT NOT NULL,"
+            " description TEXT NOT NULL,"
+            " url TEXT NOT NULL,"
+            " published TEXT NOT NULL,"
+            " polarity REAL,"
+            " label TEXT,"
+            " summary TEXT);"
+            "CREATE TABLE IF NOT EXISTS keyword_articles ("
+            " keyword TEXT NOT NULL,"
+            " source TEXT NOT NULL,"
+            " article_id INTEGER NOT NULL REFERENCES articles (id) ON DELETE CASCADE,"
+            " PRIMARY KEY (keyword, source, article_id));"
+            "CREATE TABLE IF NOT EXISTS coverage ("
+            " keyword TEXT NOT NULL,"
+            " source TEXT NOT NULL,"
+            " covered_from TEXT NOT NULL,"
+            " PRIMARY KEY (keyword, source));"
+            "CREATE INDEX IF NOT EXISTS articles_published ON articles (published);"
+        )
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.fts = self._create_fts()
+        self.conn.commit()
+
+    def _create_fts(self) -> bool:
+        try:
+            self.conn.executescript(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5("
+                " title, description, content='articles', content_rowid='id');"
+                "CREATE TRIGGER IF NOT EXISTS articles_ai AFTER INSERT ON articles BEGIN"
+                " INSERT INTO articles_fts (rowid, title, description)"
+                " VALUES (new.id, new.title, new.description); END;"
+                "CREATE TRIGGER IF NOT EXISTS articles_ad AFTER DELETE ON articles BEGIN"
+                " INSERT INTO articles_fts (articles_fts, rowid, title, description)"
+                " VALUES ('delete', old.id, old.title, old.description); END;"
+            )
+            return True
+        except sqlite3.OperationalError:  # SQLite built without FTS5
+            return False
+
+    # --- DELTA ---
+
+    def missing_windows(self, keyword: str, days: int, sources=SOURCES) -> Dict[str, List[Window]]:
+        """Per source, the (since, until) ranges of the `days` window not fetched yet."""
+        start = _window_start(days)
+        key = keyword_key(keyword)
+        windows: Dict[str, List[Window]] = {}
+        with self.lock:
+            for source in sources:
+                row = self.conn.execute(
+                    "SELECT covered_from FROM coverage WHERE keyword = ? AND source = ?", (key, source)
+                ).fetchone()
+                if row is None:
+                    windows[source] = [(None, None)]
+                    continue
+                newest = self.conn.execute(
+                    "SELECT MAX(a.published) FROM keyword_articles k JOIN articles a ON a.id = k.article_id"
+                    " WHERE k.keyword = ? AND k.source = ?", (key, source)
+                ).fetchone()[0]
+                # Upstream "from" is inclusive, so the newest stored article comes back once more.
+                ranges: List[Window] = [(newest or row[0], None)]
+                if start < row[0]:
+                    ranges.append((start, row[0]))
+                windows[source] = ranges
+        return windows
+
+    def add(self, keyword: str, days: int, fetched: Dict[str, List[dict]], errors: Dict[str, str]) -> None:
+        """Store fetched raw items and extend coverage for every source that didn't fail."""
+        key = keyword_key(keyword)
+        start = _window_start(days)
+        with self.lock:
+            for source, items in fetched.items():
+                published = []
+                for article in normalize(source, items):
+                    if article.published:
+                        published.append(article.published)
+                    self.conn.execute(
+                        "INSERT OR IGNORE INTO articles (key, source, title, description, url, published)"
+                        " VALUES (?, ?, ?, ?, ?, ?)",
+                        (article_key(article), source, article.title, article.description,
+                         article.url, article.published),
+                    )
+                    self.conn.execute(
+                        "INSERT OR IGNORE INTO keyword_articles (keyword, source, article_id)"
+                        " SELECT ?, ?, id FROM articles WHERE key = ?",
+                        (key, source, article_key(article)),
+                    )
+                if source in errors:
+                    continue
+                covered_from = start
+                known = self.conn.execute(
+                    "SELECT 1 FROM coverage WHERE keyword = ? AND source = ?", (key, source)
+                ).fetchone()
+                if known is None and published:
+                    # A first fetch is one page of the newest items; the days before
+                    # its oldest one are left for the next query's widening window.
+                    covered_from = max(start, min(published))
+                self.conn.execute(
+                    "INSERT INTO coverage (keyword, source, covered_from) VALUES (?, ?, ?)"
+                    " ON CONFLICT (keyword, source) DO UPDATE"
+                    " SET covered_from = MIN(covered_from, excluded.covered_from)",
+                    (key, source, covered_from),
+                )
+            self._prune()
+            self.conn.commit()
+
+    def _prune(self) -> None:
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=ARTICLE_STORE_RETENTION_DAYS)).strftime("%Y-%m-%d")
+        self.conn.execute("DELETE FROM articles WHERE published != '' AND published < ?", (cutoff,))
+
+    # --- READ / WRITE BACK ---
+
+    def load(self, keyword: str, days: int, per_source: int, sources=SOURCES) -> List[Article]:
+        """Newest `per_source` stored articles per source for `keyword` within `days`.
+
+        Stored polarity, label and summary come back filled in.
+        """
+        key = keyword_key(keyword)
+        start = _window_start(days)
+        articles: List[Article] = []
+        with self.lock:
+            for source in sources:
+                # k.source, not a.source: a story stored once for the first source
+                # that saw it still comes back once per source that found it.
+                rows = self.conn.execute(
+                    f"SELECT {_LINKED_COLUMNS}"
+                    " FROM keyword_articles k JOIN articles a ON a.id = k.article_id"
+                    " WHERE k.keyword = ? AND k.source = ? AND a.published >= ?"
+                    " ORDER BY a.published DESC LIMIT ?",
+                    (key, source, start, per_source),
+                ).fetchall()
+                articles.extend(_row_article(row) for row in rows)
+        return articles
+
+    def update(self, articles: List[Article]) -> None:
+        """Write polarity, label and summary back for articles already stored."""
+        with self.lock:
+            self.conn.executemany(
+                "UPDATE articles SET polarity = ?, label = ?, summary = COALESCE(?, summary) WHERE key = ?",
+                [(a.polarity, a.label, _storable_summary(a.summary), article_key(a)) for a in articles],
+            )
+            self.conn.commit()
+
+    def search(self, query: str, limit: int = 20) -> List[Article]:
+        """Full-text search over stored titles and descriptions, best match first."""
+        with self.lock:
+            if self.fts:
+                rows = self.conn.execute(
+                    f"SELECT {', '.join('a.' + c for c in _COLUMNS.split(', '))}"
+                    " FROM articles_fts f JOIN articles a ON a.id = f.rowid"
+                    " WHERE articles_fts MATCH ? ORDER BY f.rank LIMIT ?",
+                    (_fts_query(query), limit),
+                ).fetchall()
+            else:
+                like = f"%{query}%"
+                rows = self.conn.execute(
+                    f"SELECT {_COLUMNS} FROM articles WHERE title LIKE ? OR description LIKE ?"
+                    " ORDER BY published DESC LIMIT ?",
+                    (like, like, limit),
+                ).fetchall()
+        return [_row_article(row) for row in rows]
+
+    def clear(self) -> None:
+        with self.lock:
+            self.conn.execute("DELETE FROM keyword_articles")
+            self.conn.execute("DELETE FROM coverage")
+            self.conn.execute("DELETE FROM articles")
+            self.conn.commit()
+
+
+def _row_article(row) -> Article:
+    _, source, title, description, url, published, polarity, label, summary = row
+    article = Article(source, title, description, url, published)
+    article.polarity, article.label, article.summary = polarity, label, summary
+    return article
+
+
+def _storable_summary(summary: Optional[str]) -> Optional[str]:
+    # Fallback text means the call failed; leave the slot empty so it is retried.
+    return None if summary == SUMMARY_FALLBACK else summary
+
+
+def _fts_query(query: str) -> str:
+    # Quote each word so user text can't trip FTS5's query syntax.
+    return " ".join('"' + word.replace('"', '""') + '"' for word in query.split())
+
+
+# Shared by the app, the CLI and the analysis core.
+article_store = ArticleStore(ARTICLE_STORE_PATH)
@@ -0,0 +1,152 @@
+# ai_news_verifier_app/timeline.py
+"""Sentiment over time across the whole look-back window.
+
+Unlike analysis.collect_articles, which keeps the newest few articles per
+source, this walks every page each source returns (up to
+FETCH_ARTICLE_BUDGET per source) and folds each page into per-day totals
+as soon as it is scored. Only the current page and one canonical URL per
+article seen are held, so memory stays flat however many articles stream
+through. Reposts are dropped by canonical URL; headline clustering needs
+the articles themselves and is not applied here.
+"""
+import contextvars
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from typing import Dict, List, Optional
+
+import metrics
+import pipeline
+from dedup import canonical_url
+from fetchers import FETCH_ARTICLE_BUDGET, FetchError
+from sources import SOURCES, SourceAdapter
+
+
+class DayBucket:
+    """Running totals for one calendar day (UTC, from the published timestamp)."""
+
+    __slots__ = ("day", "count", "polarity_sum", "Positive", "Neutral", "Negative")
+
+    def __init__(self, day: str):
+        self.day = day
+        self.count = 0
+        self.polarity_sum = 0.0
+        self.Positive = 0
+        self.Neutral = 0
+        self.Negative = 0
+
+    def add(self, article: pipeline.Article) -> None:
+        self.count += 1
+        self.polarity_sum += article.polarity
+        setattr(self, article.label, getattr(self, article.label) + 1)
+
+    def to_dict(self) -> dict:
+        return {
+            "day": self.day,
+            "count": self.count,
+            "mean_polarity": round(self.polarity_sum / self.count, 7) if self.count else None,
+            "Positive": self.Positive,
+            "Neutral": self.Neutral,
+            "Negative": self.Negative,
+        }
+
+
+def _day(published: str) -> Optional[str]:
+    """YYYY-MM-DD from an ISO timestamp, or None when it isn't one."""
+    try:
+        return date.fromisoformat(published[:10]).isoformat()
+    except ValueError:
+        return None
+
+
+class Timeline:
+    """Thread-safe accumulator of day buckets fed page by page."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.buckets: Dict[str, DayBucket] = {}
+        self.seen_urls = set()
+        self.source_counts: Dict[str, int] = {}
+        self.undated = 0
+        self.reposts = 0
+
+    def add_page(self, source: str, items: List[dict]) -> None:
+        articles = pipeline.normalize(source, items)
+        with self.lock:
+            fresh = []
+            for article in articles:
+                url = canonical_url(article.url)
+                if url and url in self.seen_urls:
+                    self.reposts += 1
+                    continue
+                self.seen_urls.add(url)
+                fresh.append(article)
+        # Scoring is the slow part; do it outside the lock.
+        pipeline.label(pipeline.score(fresh))
+        with self.lock:
+            self.source_counts[source] = self.source_counts.get(source, 0) + len(fresh)
+            for article in fresh:
+                day = _day(article.published)
+                if day is None:
+                    self.undated += 1
+                    continue
+                if day not in self.buckets:
+                    self.buckets[day] = DayBucket(day)
+                self.buckets[day].add(article)
+
+    def days(self) -> List[dict]:
+        """Every day from the first to the last seen, empty days included."""
+        if not self.buckets:
+            return []
+        first, last = date.fromisoformat(min(self.buckets)), date.fromisoformat(max(self.buckets))
+        rows = []
+        for offset in range((last - first).days + 1):
+            day = (first + timedelta(days=offset)).isoformat()
+            rows.append((self.buckets.get(day) or DayBucket(day)).to_dict())
+        return rows
+
+
+def _consume(timeline: Timeline, adapter: SourceAdapter, keyword: str, days: int, budget: int) -> None:
+    deadline = time.monotonic() + adapter.walk_timeout
+    with metrics.span(f"timeline_{adapter.name}"):
+        for page in adapter.pages(keyword, days, min(budget, adapter.budget)):
+            timeline.add_page(adapter.name, page)
+            if time.monotonic() > deadline:
+                metrics.inc("fetch_timeouts_total", source=adapter.name)
+                raise FetchError(f"timed out after {adapter.walk_timeout:g}s")
+
+
+def sentiment_timeline(keyword: str, days: int, budget: int = FETCH_ARTICLE_BUDGET) -> dict:
+    """Per-day article counts, label counts and mean polarity for `keyword`.
+
+    Sources are walked concurrently, each up to the smaller of `budget` and
+    its own budget. A source that fails or runs past its walk timeout
+    part-way keeps the pages it already delivered and reports its error
+    under "errors".
+    """
+    timeline = Timeline()
+    errors: Dict[str, str] = {}
+    # max(1, ...): with no sources registered the walk is empty, not a ValueError.
+    with metrics.span("timeline"), ThreadPoolExecutor(max_workers=max(1, len(SOURCES))) as pool:
+        futures = {
+            name: pool.submit(contextvars.copy_context().run, _consume, timeline, adapter, keyword, days, budget)
+            for name, adapter in SOURCES.items()
+        }
+        for source, future in futures.items():
+            try:
+                future.result()
+            except Exception as e:
+                errors[source] = str(e)
+
+    return {
+        "keyword": keyword,
+        "days": days,
+        "buckets": timeline.days(),
+        "article_count": sum(timeline.source_counts.values()),
+        "source_counts": dict(timeline.source_counts),
+        "reposts_skipped": timeline.reposts,
+        "undated": timeline.undated,
+        "budget_per_source": budget,
+        "errors": errors,
+    }